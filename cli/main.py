@@ -846,7 +846,7 @@ def run_analysis():
         init_agent_state = graph.propagator.create_initial_state(
             selections["ticker"], selections["analysis_date"]
         )
-        args = graph.propagator.get_graph_args()
+        args = graph.graph_args(selections["ticker"], selections["analysis_date"])
 
         # Stream the analysis
         trace = []
@@ -0,0 +1,123 @@
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from tradingagents.graph import backtest
+from tradingagents.graph.backtest import BacktestRunner
+from tradingagents.graph.propagation import Propagator
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+
+class StubState(TypedDict, total=False):
+    company_of_interest: str
+    trade_date: str
+    steps: Annotated[List[str], operator.add]
+    final_trade_decision: str
+
+
+class StubGraph:
+    """Two-node stand-in for TradingAgentsGraph whose second node can be made to crash."""
+
+    thread_id = staticmethod(TradingAgentsGraph.thread_id)
+    graph_args = TradingAgentsGraph.graph_args
+
+    def __init__(self, selected_analysts, debug=False, config=None, checkpointer=None):
+        self.checkpointer = checkpointer
+        self.propagator = Propagator()
+        self.crash = set()
+        self.runs = []
+        self.prepared = []
+        self.released = []
+
+        def analyze(state):
+            self.runs.append(("analyze", state["company_of_interest"], state["trade_date"]))
+            return {"steps": ["analyze"]}
+
+        def decide(state):
+            key = (state["company_of_interest"], state["trade_date"])
+            self.runs.append(("decide",) + key)
+            if key in self.crash:
+                raise RuntimeError("interrupted")
+            return {"steps": ["decide"], "final_trade_decision": "FINAL TRANSACTION PROPOSAL: **BUY**"}
+
+        builder = StateGraph(StubState)
+        builder.add_node("analyze", analyze)
+        builder.add_node("decide", decide)
+        builder.add_edge(START, "analyze")
+        builder.add_edge("analyze", "decide")
+        builder.add_edge("decide", END)
+        self.graph = builder.compile(checkpointer=checkpointer)
+
+    def prefetch(self, company_name, trade_date):
+        pass
+
+    def log_state(self, trade_date, final_state):
+        pass
+
+    def process_signal(self, full_signal):
+        return "BUY"
+
+    def prepare_batch_dates(self, pairs):
+        dates = sorted({date for _, date in pairs})
+        self.prepared.append(dates)
+        return dates
+
+    def release_batch_dates(self, dates):
+        self.released.append(dates)
+
+
+@pytest.fixture
+def make_runner(tmp_path, monkeypatch):
+    monkeypatch.setattr(backtest, "TradingAgentsGraph", StubGraph)
+    runners = []
+
+    def make():
+        runner = BacktestRunner(str(tmp_path / "backtest.sqlite"))
+        runners.append(runner)
+        return runner
+
+    yield make
+    for runner in runners:
+        runner.close()
+
+
+def test_restart_skips_completed_and_resumes_interrupted(make_runner):
+    runner = make_runner()
+    runner.ta.crash.add(("MSFT", "2024-01-02"))
+
+    results = runner.run(["AAPL", "MSFT"], ["2024-01-02"])
+    assert next(results)["ticker"] == "AAPL"
+    with pytest.raises(RuntimeError):
+        next(results)
+    assert runner.ta.released == [["2024-01-02"]]
+    runner.close()
+
+    runner = make_runner()
+    results = list(runner.run(["AAPL", "MSFT"], ["2024-01-02"]))
+
+    assert [r["ticker"] for r in results] == ["MSFT"]
+    # MSFT continues at the crashed node; its analysis is not repeated
+    assert runner.ta.runs == [("decide", "MSFT", "2024-01-02")]
+    assert results[0]["final_state"]["steps"] == ["analyze", "decide"]
+    assert [(r["ticker"], r["decision"]) for r in runner.results()] == [
+        ("AAPL", "BUY"),
+        ("MSFT", "BUY"),
+    ]
+    assert runner.get_final_state("AAPL", "2024-01-02")["steps"] == ["analyze", "decide"]
+
+
+def test_runs_date_by_date_and_skips_finished_dates(make_runner):
+    runner = make_runner()
+    list(runner.run(["AAPL"], ["2024-01-02"]))
+
+    results = list(runner.run(["AAPL", "MSFT"], ["2024-01-02", "2024-01-03"]))
+
+    assert [(r["ticker"], r["trade_date"]) for r in results] == [
+        ("MSFT", "2024-01-02"),
+        ("AAPL", "2024-01-03"),
+        ("MSFT", "2024-01-03"),
+    ]
+    assert runner.ta.prepared == [["2024-01-02"], ["2024-01-02"], ["2024-01-03"]]
+    assert runner.ta.released == runner.ta.prepared
@@ -0,0 +1,58 @@
+import numpy as np
+
+from tradingagents.dataflows.indicator_engine import IndicatorEngine
+from tradingagents.dataflows.numpy_indicators import SUPPORTED_INDICATORS
+
+from .test_numpy_indicators import make_prices
+
+
+def make_engine():
+    return IndicatorEngine(SUPPORTED_INDICATORS)
+
+
+def test_extend_matches_full_compute():
+    engine = make_engine()
+    data = make_prices(n=600)
+    previous = engine.compute(data.iloc[:580])
+
+    extended = engine.extend(previous, data)
+    expected = engine.compute(data)
+
+    assert extended is not None
+    np.testing.assert_array_equal(extended.dates, expected.dates)
+    for name in SUPPORTED_INDICATORS:
+        np.testing.assert_allclose(
+            extended.columns[name], expected.columns[name], rtol=1e-9, atol=1e-9, err_msg=name
+        )
+
+
+def test_extend_without_new_bars_returns_previous():
+    engine = make_engine()
+    data = make_prices(n=300)
+    previous = engine.compute(data)
+    assert engine.extend(previous, data) is previous
+
+
+def test_extend_rejects_readjusted_history():
+    engine = make_engine()
+    data = make_prices(n=300)
+    previous = engine.compute(data.iloc[:290])
+
+    adjusted = data.copy()
+    adjusted[["Open", "High", "Low", "Close"]] *= 0.5
+    assert engine.extend(previous, adjusted) is None
+
+
+def test_extend_rejects_missing_prices_in_new_bars():
+    engine = make_engine()
+    data = make_prices(n=300)
+    previous = engine.compute(data.iloc[:290])
+
+    data.loc[295, "Close"] = np.nan
+    assert engine.extend(previous, data) is None
+
+
+def test_missing_prices_disable_incremental_state():
+    data = make_prices(n=300)
+    data.loc[100, "High"] = np.nan
+    assert make_engine().compute(data).state is None
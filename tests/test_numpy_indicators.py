@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.numpy_indicators import (
+    SUPPORTED_INDICATORS,
+    compute_indicators,
+    compute_with_stockstats,
+    parity_report,
+)
+
+
+def make_prices(n: int = 2500, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2010-01-01", periods=n).strftime("%Y-%m-%d"),
+            "Open": close,
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, n).astype(float),
+        }
+    )
+
+
+def assert_parity(data: pd.DataFrame):
+    report = parity_report(data)
+    mismatched = {name: r["max_abs_error"] for name, r in report.items() if not r["ok"]}
+    assert not mismatched
+
+
+def test_parity_with_stockstats():
+    assert_parity(make_prices())
+
+
+@pytest.mark.parametrize("column", ["Close", "High", "Volume"])
+def test_parity_with_missing_price(column):
+    data = make_prices()
+    data.loc[100, column] = np.nan
+    assert_parity(data)
+
+
+def test_missing_close_is_skipped_like_pandas():
+    data = make_prices()
+    data.loc[100, "Close"] = np.nan
+
+    actual = compute_indicators(data)
+    expected = compute_with_stockstats(data)
+    for name in SUPPORTED_INDICATORS:
+        assert np.isnan(actual[name]).sum() == np.isnan(expected[name]).sum(), name
+    assert np.isnan(actual["close_50_sma"]).sum() == 0
+
+
+def test_short_history():
+    assert_parity(make_prices(n=5))
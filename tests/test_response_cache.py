@@ -0,0 +1,84 @@
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.interface import _cacheable, route_to_vendor
+
+
+@pytest.fixture
+def vendor_env(tmp_path, monkeypatch):
+    saved = get_config()
+    set_config(
+        {
+            "data_cache_dir": str(tmp_path),
+            "response_cache": {**saved["response_cache"], "enabled": True, "path": None},
+            "data_vendors": {**saved["data_vendors"], "news_data": "local"},
+            "tool_vendors": {},
+        }
+    )
+    calls = []
+
+    def install(*impls):
+        def wrap(impl):
+            def call(*args, **kwargs):
+                calls.append(impl.__name__)
+                return impl(*args, **kwargs)
+
+            call.__name__ = impl.__name__
+            return call
+
+        monkeypatch.setitem(interface.VENDOR_METHODS, "get_news", {"local": [wrap(i) for i in impls]})
+
+    yield install, calls
+    set_config(saved)
+
+
+def articles(*args):
+    return "## AAPL News\n- Apple ships a new phone"
+
+
+def no_data(*args):
+    return "No news data found for AAPL"
+
+
+def broken(*args):
+    raise ValueError("feed unavailable")
+
+
+@pytest.mark.parametrize(
+    "result, complete, expected",
+    [
+        ("## News\n- headline", True, True),
+        ({"rows": 3}, True, True),
+        ("## News\n- headline", False, False),
+        (None, True, False),
+        ("", True, False),
+        ("   \n", True, False),
+        ("No data found for AAPL", True, False),
+        ("No news data found for AAPL between 2024-01-01 and 2024-01-08", True, False),
+        ("Error: rate limited", True, False),
+    ],
+)
+def test_cacheable(result, complete, expected):
+    assert _cacheable(result, complete) is expected
+
+
+def test_complete_result_is_served_from_cache(vendor_env):
+    install, calls = vendor_env
+    install(articles)
+
+    first = route_to_vendor("get_news", "AAPL", "2024-01-02", "2024-01-09")
+    second = route_to_vendor("get_news", "AAPL", "2024-01-02", "2024-01-09")
+    assert first == second
+    assert calls == ["articles"]
+
+
+@pytest.mark.parametrize("impls", [(no_data,), (articles, broken)])
+def test_partial_or_empty_result_is_refetched(vendor_env, impls):
+    install, calls = vendor_env
+    install(*impls)
+
+    route_to_vendor("get_news", "AAPL", "2024-01-02", "2024-01-09")
+    route_to_vendor("get_news", "AAPL", "2024-01-02", "2024-01-09")
+    # Implementations run concurrently, so only the counts are stable
+    assert sorted(calls) == sorted(impl.__name__ for impl in impls * 2)
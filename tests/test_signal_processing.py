@@ -0,0 +1,40 @@
+import pytest
+
+from tradingagents.graph.signal_processing import SignalProcessor
+
+
+@pytest.mark.parametrize(
+    "signal, expected",
+    [
+        ("Strong momentum.\n\nFINAL TRANSACTION PROPOSAL: **BUY**", "BUY"),
+        ("final decision: sell", "SELL"),
+        ("FINAL RECOMMENDATION: **HOLD**", "HOLD"),
+        ("综合分析后，最终交易建议：**买入**", "BUY"),
+        ("最终决策: 卖出", "SELL"),
+        ("最终建议：持有", "HOLD"),
+        (
+            "FINAL TRANSACTION PROPOSAL: **HOLD**\n...\nFINAL TRANSACTION PROPOSAL: **HOLD**",
+            "HOLD",
+        ),
+    ],
+)
+def test_explicit_final_proposal(signal, expected):
+    assert SignalProcessor.extract_decision(signal) == expected
+
+
+@pytest.mark.parametrize(
+    "signal",
+    [
+        # Decision words outside a final marker are left to the LLM
+        "建议: 买入部分，卖出其余",
+        "交易建议：卖出。但考虑到风险，建议：持有观望",
+        "The bear argues we should **SELL**, but the fundamentals favour holding.",
+        # The final decision must stand alone
+        "最终交易建议：买入部分仓位",
+        # Conflicting final markers are ambiguous
+        "FINAL TRANSACTION PROPOSAL: **BUY**\n最终交易建议：卖出",
+        "No recommendation was reached.",
+    ],
+)
+def test_ambiguous_signal_returns_none(signal):
+    assert SignalProcessor.extract_decision(signal) is None
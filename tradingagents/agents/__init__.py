@@ -1,4 +1,4 @@
-from .utils.agent_utils import create_msg_delete
+from .utils.agent_utils import create_msg_delete, create_situation_embedder
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
 from .utils.memory import FinancialSituationMemory
 
@@ -23,6 +23,7 @@ __all__ = [
     "FinancialSituationMemory",
     "AgentState",
     "create_msg_delete",
+    "create_situation_embedder",
     "InvestDebateState",
     "RiskDebateState",
     "create_bear_researcher",
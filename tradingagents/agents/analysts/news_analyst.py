@@ -3,6 +3,7 @@ import time
 import json
 from tradingagents.agents.utils.agent_utils import get_news, get_global_news
 from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.date_context import get_shared_context
 
 
 def create_news_analyst(llm):
@@ -10,15 +11,30 @@ def create_news_analyst(llm):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
 
-        tools = [
-            get_news,
-            get_global_news,
-        ]
+        # Global news shared by every ticker on this date, filled once by a batch run
+        shared_context = get_shared_context(current_date)
+
+        if shared_context is None:
+            tools = [
+                get_news,
+                get_global_news,
+            ]
+            tool_usage = "Use the available tools: get_news(query, start_date, end_date) for company-specific or targeted news searches, and get_global_news(curr_date, look_back_days, limit) for broader macroeconomic news."
+        else:
+            tools = [
+                get_news,
+            ]
+            tool_usage = "Use the available tool get_news(query, start_date, end_date) for company-specific or targeted news searches. The broader macroeconomic news of the past week has already been retrieved for this date and is provided at the end of these instructions; do not request it again."
 
         system_message = (
-            "You are a news researcher tasked with analyzing recent news and trends over the past week. Please write a comprehensive report of the current state of the world that is relevant for trading and macroeconomics. Use the available tools: get_news(query, start_date, end_date) for company-specific or targeted news searches, and get_global_news(curr_date, look_back_days, limit) for broader macroeconomic news. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions. **请用中文撰写所有分析内容和报告。**"
+            "You are a news researcher tasked with analyzing recent news and trends over the past week. Please write a comprehensive report of the current state of the world that is relevant for trading and macroeconomics. "
+            + tool_usage
+            + " Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions. **请用中文撰写所有分析内容和报告。**"
             + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
         )
+        if shared_context is not None:
+            macro_news = shared_context["digest"] or shared_context["global_news"]
+            system_message += f"\n\nGlobal macroeconomic news for {current_date}:\n{macro_news}\n"
 
         prompt = ChatPromptTemplate.from_messages(
             [
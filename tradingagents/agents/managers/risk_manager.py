@@ -16,7 +16,9 @@ def create_risk_manager(llm, memory):
         trader_plan = state["investment_plan"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation, n_matches=2, situation_embedding=state.get("situation_embedding")
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -20,6 +20,15 @@ from tradingagents.agents.utils.news_data_tools import (
     get_global_news
 )
 
+def create_situation_embedder(memory):
+    def embed_situation(state):
+        """Embed the four analyst reports once for all memory lookups of this run"""
+        curr_situation = f"{state['market_report']}\n\n{state['sentiment_report']}\n\n{state['news_report']}\n\n{state['fundamentals_report']}"
+        return {"situation_embedding": list(memory.get_embedding(curr_situation))}
+
+    return embed_situation
+
+
 def create_msg_delete():
     def delete_messages(state):
         """Clear messages and add placeholder for Anthropic compatibility"""
@@ -1,7 +1,13 @@
+import os
+import hashlib
+
 import chromadb
 from chromadb.config import Settings
 from openai import OpenAI
 
+from tradingagents.dataflows.response_cache import ResponseCache
+from tradingagents.agents.utils.vector_store import HashingEmbedder, LocalVectorStore
+
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
@@ -15,44 +21,145 @@ class FinancialSituationMemory:
             # 对于其他情况,使用兼容的 embedding 模型
             self.embedding = "Qwen/Qwen3-Embedding-8B"
         
-        self.client = OpenAI(base_url=config["backend_url"])
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.create_collection(name=name)
+        self.batch_size = config.get("embedding_batch_size", 32)
+
+        # Reflections are persisted under results_dir so they survive restarts
+        memory_dir = config.get("memory_dir") or os.path.join(
+            config["results_dir"], "memory"
+        )
+        os.makedirs(memory_dir, exist_ok=True)
+
+        # "api" calls the embeddings endpoint, "hashing" embeds locally without network
+        self.embedding_backend = config.get("embedding_backend", "api")
+        if self.embedding_backend == "hashing":
+            self.embedder = HashingEmbedder(config.get("hashing_embedding_dim", 1024))
+        elif self.embedding_backend == "api":
+            self.client = OpenAI(base_url=config["backend_url"])
+            # Embeddings never change for a given (model, text), so cache them permanently
+            self.embedding_cache = ResponseCache(
+                os.path.join(memory_dir, "embedding_cache.sqlite")
+            )
+        else:
+            raise ValueError(f"Unsupported embedding backend: {self.embedding_backend}")
+
+        # "chroma" uses a persistent Chroma collection, "local" a NumPy matrix on disk
+        self.memory_backend = config.get("memory_backend", "chroma")
+        if self.memory_backend == "local":
+            self.vector_store = LocalVectorStore(
+                os.path.join(memory_dir, f"{name}-{self.embedding_backend}.npz")
+            )
+        elif self.memory_backend == "chroma":
+            self.chroma_client = chromadb.PersistentClient(
+                path=memory_dir, settings=Settings(allow_reset=True)
+            )
+            self.situation_collection = self.chroma_client.get_or_create_collection(
+                name=f"{name}_hashing" if self.embedding_backend == "hashing" else name
+            )
+        else:
+            raise ValueError(f"Unsupported memory backend: {self.memory_backend}")
+
+    def _embedding_key(self, text):
+        return hashlib.sha256(f"{self.embedding}\n{text}".encode("utf-8")).hexdigest()
+
+    def get_embeddings(self, texts):
+        """Get embeddings for several texts, batching the requests for cache misses"""
+        if self.embedding_backend == "hashing":
+            return self.embedder.embed(texts).tolist()
+
+        embeddings = [None] * len(texts)
+        missing = {}  # cache key -> (text, positions)
+
+        for i, text in enumerate(texts):
+            key = self._embedding_key(text)
+            hit, embedding = self.embedding_cache.get("embedding", key)
+            if hit:
+                embeddings[i] = embedding
+            else:
+                missing.setdefault(key, (text, []))[1].append(i)
+
+        keys = list(missing)
+        for start in range(0, len(keys), self.batch_size):
+            batch = keys[start : start + self.batch_size]
+            response = self.client.embeddings.create(
+                model=self.embedding, input=[missing[key][0] for key in batch]
+            )
+            for key, item in zip(batch, sorted(response.data, key=lambda d: d.index)):
+                self.embedding_cache.set("embedding", key, item.embedding, None)
+                for i in missing[key][1]:
+                    embeddings[i] = item.embedding
+
+        return embeddings
 
     def get_embedding(self, text):
         """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
-        )
-        return response.data[0].embedding
+        return self.get_embeddings([text])[0]
 
-    def add_situations(self, situations_and_advice):
-        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
+    def add_situations(self, situations_and_advice, embeddings=None):
+        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec).
+        ``embeddings`` optionally gives the precomputed embedding of each situation."""
 
         situations = []
         advice = []
         ids = []
-        embeddings = []
-
-        offset = self.situation_collection.count()
+        seen_ids = set()
+        given_embeddings = []
 
         for i, (situation, recommendation) in enumerate(situations_and_advice):
+            # Content-derived ids keep repeated reflections from piling up
+            entry_id = hashlib.sha256(
+                f"{situation}\n{recommendation}".encode("utf-8")
+            ).hexdigest()
+            if entry_id in seen_ids:
+                continue
+            seen_ids.add(entry_id)
             situations.append(situation)
             advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+            ids.append(entry_id)
+            if embeddings is not None:
+                given_embeddings.append(list(embeddings[i]))
+
+        if not situations:
+            return
 
-        self.situation_collection.add(
+        if embeddings is None:
+            embeddings = self.get_embeddings(situations)
+        else:
+            embeddings = given_embeddings
+
+        if self.memory_backend == "local":
+            self.vector_store.upsert(
+                ids=ids,
+                documents=situations,
+                metadatas=[{"recommendation": rec} for rec in advice],
+                embeddings=embeddings,
+            )
+            return
+
+        self.situation_collection.upsert(
             documents=situations,
             metadatas=[{"recommendation": rec} for rec in advice],
             embeddings=embeddings,
             ids=ids,
         )
 
-    def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using OpenAI embeddings"""
-        query_embedding = self.get_embedding(current_situation)
+    def get_memories(self, current_situation, n_matches=1, situation_embedding=None):
+        """Find matching recommendations using OpenAI embeddings.
+        Pass ``situation_embedding`` to reuse a vector that was already computed."""
+        if situation_embedding is None:
+            situation_embedding = self.get_embedding(current_situation)
+        return self.get_memories_by_embedding(situation_embedding, n_matches)
+
+    def get_memories_by_embedding(self, query_embedding, n_matches=1):
+        """Find matching recommendations for a precomputed situation embedding"""
+        if self.memory_backend == "local":
+            return [
+                {
+                    "matched_situation": match["document"],
+                    "recommendation": match["metadata"]["recommendation"],
+                    "similarity_score": match["score"],
+                }
+                for match in self.vector_store.query(query_embedding, n_matches)
+            ]
 
         results = self.situation_collection.query(
             query_embeddings=[query_embedding],
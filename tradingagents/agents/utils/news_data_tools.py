@@ -1,6 +1,7 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import route_to_vendor, aroute_to_vendor
+from tradingagents.dataflows.date_context import get_shared_global_news
 
 @tool
 def get_news(
@@ -36,6 +37,10 @@ def get_global_news(
     Returns:
         str: A formatted string containing global news data
     """
+    # A batch run may have fetched this date's global news once for all tickers
+    shared = get_shared_global_news(curr_date, look_back_days, limit)
+    if shared is not None:
+        return shared
     return route_to_vendor("get_global_news", curr_date, look_back_days, limit)
 
 @tool
@@ -69,3 +74,28 @@ def get_insider_transactions(
         str: A report of insider transaction data
     """
     return route_to_vendor("get_insider_transactions", ticker, curr_date)
+
+
+# Async implementations, used when the graph runs on an event loop (ainvoke/astream)
+async def _aget_news(ticker, start_date, end_date) -> str:
+    return await aroute_to_vendor("get_news", ticker, start_date, end_date)
+
+get_news.coroutine = _aget_news
+
+async def _aget_global_news(curr_date, look_back_days=7, limit=5) -> str:
+    shared = get_shared_global_news(curr_date, look_back_days, limit)
+    if shared is not None:
+        return shared
+    return await aroute_to_vendor("get_global_news", curr_date, look_back_days, limit)
+
+get_global_news.coroutine = _aget_global_news
+
+async def _aget_insider_sentiment(ticker, curr_date) -> str:
+    return await aroute_to_vendor("get_insider_sentiment", ticker, curr_date)
+
+get_insider_sentiment.coroutine = _aget_insider_sentiment
+
+async def _aget_insider_transactions(ticker, curr_date) -> str:
+    return await aroute_to_vendor("get_insider_transactions", ticker, curr_date)
+
+get_insider_transactions.coroutine = _aget_insider_transactions
@@ -0,0 +1,233 @@
+import os
+import re
+import json
+import math
+import base64
+import tempfile
+import threading
+import zlib
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.'][a-z0-9]+)*")
+CJK_PATTERN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+
+
+class HashingEmbedder:
+    """Embedding-free text vectorizer based on the hashing trick.
+
+    Latin text is split into lowercase word tokens and adjacent word pairs. CJK runs,
+    which have no spaces, are split into character bigrams. Each feature is hashed
+    with crc32 into ``dim`` signed buckets with sublinear term frequency, and every
+    vector is L2-normalized, so a dot product is the cosine similarity.
+    """
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+
+    def _features(self, text: str) -> List[str]:
+        text = text.lower()
+        words = TOKEN_PATTERN.findall(text)
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        for run in CJK_PATTERN.findall(text):
+            features.extend([run] if len(run) == 1 else [run[i : i + 2] for i in range(len(run) - 1)])
+        return features
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts: Dict[int, float] = {}
+            for feature in self._features(text):
+                h = zlib.crc32(feature.encode("utf-8"))
+                bucket = h % self.dim
+                sign = 1.0 if (h >> 31) & 1 == 0 else -1.0
+                counts[bucket] = counts.get(bucket, 0.0) + sign
+            for bucket, count in counts.items():
+                vectors[row, bucket] = math.copysign(1.0 + math.log(abs(count)), count) if count else 0.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class LocalVectorStore:
+    """In-process cosine-similarity store over a contiguous float32 matrix.
+
+    Rows are L2-normalized on insert, so the top-k search is one matrix-vector
+    product followed by ``argpartition``. With ``path`` set, the store persists to
+    an ``.npz`` snapshot plus an append-only journal (``path + ".log"``) of the
+    rows upserted since. Each upsert only appends its rows to the journal; the
+    snapshot is rewritten, and the journal emptied, once the journal holds more
+    rows than the snapshot, so persisting stays amortized O(1) per row.
+    """
+
+    COMPACT_MIN_ROWS = 256
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.journal_path = path + ".log" if path else None
+        self._lock = threading.Lock()
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._size = 0
+        self._ids: Dict[str, int] = {}
+        self._documents: List[str] = []
+        self._metadatas: List[dict] = []
+        self._journal_rows = 0
+        if path and os.path.exists(path):
+            self._load()
+        if path and os.path.exists(self.journal_path) and not self._replay():
+            # Later appends would be glued onto the torn line, so fold it away now
+            self._compact()
+
+    def count(self) -> int:
+        return self._size
+
+    def _load(self):
+        with np.load(self.path) as snapshot:
+            self._matrix = np.ascontiguousarray(snapshot["vectors"], dtype=np.float32)
+            records = json.loads(str(snapshot["records"]))
+        self._size = len(records)
+        self._documents = [r["document"] for r in records]
+        self._metadatas = [r["metadata"] for r in records]
+        self._ids = {r["id"]: i for i, r in enumerate(records)}
+
+    def _replay(self) -> bool:
+        """Apply the journal; returns False if it ends in a torn write."""
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A write cut short by a crash; everything before it is intact
+                    return False
+                vector = np.frombuffer(base64.b64decode(record["vector"]), dtype=np.float32)
+                self._insert(record["id"], record["document"], record["metadata"], vector)
+                self._journal_rows += 1
+        return True
+
+    def _append(self, ids: Sequence[str], rows: Sequence[int]):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(
+                "".join(
+                    json.dumps(
+                        {
+                            "id": entry_id,
+                            "document": self._documents[row],
+                            "metadata": self._metadatas[row],
+                            "vector": base64.b64encode(self._matrix[row].tobytes()).decode("ascii"),
+                        },
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                    for entry_id, row in zip(ids, rows)
+                )
+            )
+        self._journal_rows += len(rows)
+
+    def _compact(self):
+        """Rewrite the snapshot with every row and empty the journal."""
+        records = [
+            {"id": entry_id, "document": self._documents[i], "metadata": self._metadatas[i]}
+            for entry_id, i in sorted(self._ids.items(), key=lambda item: item[1])
+        ]
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp.npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    vectors=self._matrix[: self._size],
+                    records=np.array(json.dumps(records, ensure_ascii=False)),
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        # Replaying a journal onto a snapshot that already holds its rows is harmless
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_rows = 0
+
+    def _insert(self, entry_id: str, document: str, metadata: dict, vector: np.ndarray) -> int:
+        if self._size == 0 and self._matrix.shape[1] != len(vector):
+            self._matrix = np.zeros((0, len(vector)), dtype=np.float32)
+        row = self._ids.get(entry_id)
+        if row is None:
+            if self._size == len(self._matrix):
+                # Grow geometrically so inserts stay amortized O(1)
+                grown = np.zeros(
+                    (max(16, 2 * len(self._matrix)), self._matrix.shape[1]),
+                    dtype=np.float32,
+                )
+                grown[: self._size] = self._matrix[: self._size]
+                self._matrix = grown
+            row = self._size
+            self._size += 1
+            self._ids[entry_id] = row
+            self._documents.append(document)
+            self._metadatas.append(metadata)
+        else:
+            self._documents[row] = document
+            self._metadatas[row] = metadata
+        self._matrix[row] = vector
+        return row
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        documents: Sequence[str],
+        metadatas: Sequence[dict],
+        embeddings,
+    ):
+        """Insert rows, replacing any existing row with the same id."""
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(ids):
+            raise ValueError("Expected one embedding per id")
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+        with self._lock:
+            if self._size == 0 and self._matrix.shape[1] != vectors.shape[1]:
+                self._matrix = np.zeros((0, vectors.shape[1]), dtype=np.float32)
+            elif vectors.shape[1] != self._matrix.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match the store ({self._matrix.shape[1]})"
+                )
+
+            rows = [
+                self._insert(entry_id, document, metadata, vector)
+                for entry_id, document, metadata, vector in zip(ids, documents, metadatas, vectors)
+            ]
+
+            if self.path and rows:
+                if self._journal_rows + len(rows) > max(self.COMPACT_MIN_ROWS, self._size):
+                    self._compact()
+                else:
+                    self._append(ids, rows)
+
+    def query(self, embedding, n_results: int = 1) -> List[dict]:
+        """Return the ``n_results`` most similar rows, best first."""
+        with self._lock:
+            if self._size == 0 or n_results <= 0:
+                return []
+            query = np.asarray(embedding, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            if norm > 0:
+                query = query / norm
+
+            scores = self._matrix[: self._size] @ query
+            k = min(n_results, self._size)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            return [
+                {
+                    "document": self._documents[i],
+                    "metadata": self._metadatas[i],
+                    "score": float(scores[i]),
+                }
+                for i in top
+            ]
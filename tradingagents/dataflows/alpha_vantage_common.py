@@ -1,10 +1,18 @@
 import os
+import asyncio
+import threading
+import weakref
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import json
 from datetime import datetime
 from io import StringIO
 
+from .config import get_config
+from .rate_limiter import KeyRotatingRateLimiter
+
 API_BASE_URL = "https://www.alphavantage.co/query"
 
 def get_api_key() -> str:
@@ -14,6 +22,15 @@ def get_api_key() -> str:
         raise ValueError("ALPHA_VANTAGE_API_KEY environment variable is not set.")
     return api_key
 
+def get_api_keys() -> list:
+    """Retrieve all Alpha Vantage API keys.
+
+    ``ALPHA_VANTAGE_API_KEYS`` (comma-separated) takes precedence over the single
+    ``ALPHA_VANTAGE_API_KEY``.
+    """
+    api_keys = [k.strip() for k in os.getenv("ALPHA_VANTAGE_API_KEYS", "").split(",") if k.strip()]
+    return api_keys or [get_api_key()]
+
 def format_datetime_for_api(date_input) -> str:
     """Convert various date formats to YYYYMMDDTHHMM format required by Alpha Vantage API."""
     if isinstance(date_input, str):
@@ -39,17 +56,46 @@ class AlphaVantageRateLimitError(Exception):
     """Exception raised when Alpha Vantage API rate limit is exceeded."""
     pass
 
-def _make_api_request(function_name: str, params: dict) -> dict | str:
-    """Helper function to make API requests and handle responses.
-    
-    Raises:
-        AlphaVantageRateLimitError: When API rate limit is exceeded
-    """
+_session = None
+_limiter = None
+_client_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Return the shared keep-alive session used for all Alpha Vantage requests."""
+    global _session
+    with _client_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=get_config().get("vendor_max_workers", 8))
+            _session.mount("https://", adapter)
+        return _session
+
+def get_rate_limiter() -> KeyRotatingRateLimiter:
+    """Return the process-wide limiter sized to the configured key quota."""
+    global _limiter
+    with _client_lock:
+        if _limiter is None:
+            limits = get_config().get("alpha_vantage_rate_limit", {})
+            _limiter = KeyRotatingRateLimiter(
+                get_api_keys(),
+                per_minute=limits.get("per_minute", 5),
+                per_day=limits.get("per_day", 25),
+                max_wait=limits.get("max_wait", 60),
+                exhausted_error=AlphaVantageRateLimitError,
+            )
+        return _limiter
+
+def get_rate_limit_stats() -> dict:
+    """Rate-limit headroom and counters for each Alpha Vantage key."""
+    return get_rate_limiter().stats()
+
+def _prepare_params(function_name: str, params: dict, api_key: str) -> dict:
+    """Build the full query parameters for an API request."""
     # Create a copy of params to avoid modifying the original
     api_params = params.copy()
     api_params.update({
         "function": function_name,
-        "apikey": get_api_key(),
+        "apikey": api_key,
         "source": "trading_agents",
     })
     
@@ -62,12 +108,11 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     elif "entitlement" in api_params:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
-    
-    response = requests.get(API_BASE_URL, params=api_params)
-    response.raise_for_status()
 
-    response_text = response.text
-    
+    return api_params
+
+def _check_response(response_text: str, api_key: str) -> str:
+    """Raise AlphaVantageRateLimitError if the response reports a rate limit."""
     # Check if response is JSON (error responses are typically JSON)
     try:
         response_json = json.loads(response_text)
@@ -75,6 +120,8 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
         if "Information" in response_json:
             info_message = response_json["Information"]
             if "rate limit" in info_message.lower() or "api key" in info_message.lower():
+                # Our bucket was out of sync with the server; stop using this key for now
+                get_rate_limiter().penalize(api_key)
                 raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
     except json.JSONDecodeError:
         # Response is not JSON (likely CSV data), which is normal
@@ -82,6 +129,51 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
 
     return response_text
 
+def _make_api_request(function_name: str, params: dict) -> dict | str:
+    """Helper function to make API requests and handle responses.
+    
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    api_key = get_rate_limiter().reserve()
+    response = get_session().get(
+        API_BASE_URL, params=_prepare_params(function_name, params, api_key), timeout=30
+    )
+    response.raise_for_status()
+
+    return _check_response(response.text, api_key)
+
+# httpx clients are bound to the event loop they were created on
+_async_clients = weakref.WeakKeyDictionary()
+
+def _get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(timeout=30)
+        _async_clients[loop] = client
+    return client
+
+async def aclose_async_client():
+    """Close the running loop's ``httpx.AsyncClient``, if one was opened."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+async def _amake_api_request(function_name: str, params: dict) -> dict | str:
+    """Async variant of ``_make_api_request`` using a shared ``httpx.AsyncClient``.
+    
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    api_key = await get_rate_limiter().areserve()
+    response = await _get_async_client().get(
+        API_BASE_URL, params=_prepare_params(function_name, params, api_key)
+    )
+    response.raise_for_status()
+
+    return _check_response(response.text, api_key)
+
 
 
 def _filter_csv_by_date_range(csv_data: str, start_date: str, end_date: str) -> str:
@@ -1,4 +1,164 @@
+import os
+import json
+import bisect
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime as _datetime
+
 from .alpha_vantage_common import _make_api_request
+from .config import get_config
+
+# indicator -> (Alpha Vantage function, fixed time period or None for the caller's)
+INDICATOR_FUNCTIONS = {
+    "close_50_sma": ("SMA", "50"),
+    "close_200_sma": ("SMA", "200"),
+    "close_10_ema": ("EMA", "10"),
+    "macd": ("MACD", None),
+    "macds": ("MACD", None),
+    "macdh": ("MACD", None),
+    "rsi": ("RSI", None),
+    "boll": ("BBANDS", "20"),
+    "boll_ub": ("BBANDS", "20"),
+    "boll_lb": ("BBANDS", "20"),
+    "atr": ("ATR", None),
+}
+
+# Parsed series kept in memory, least recently used evicted first
+MAX_CACHED_SERIES = 64
+
+_series_cache = OrderedDict()
+_series_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _series_lock(key) -> threading.Lock:
+    """Return the lock serializing downloads of one indicator series."""
+    with _locks_guard:
+        return _series_locks.setdefault(key, threading.Lock())
+
+
+def _cache_get(key):
+    with _locks_guard:
+        cached = _series_cache.get(key)
+        if cached is not None:
+            _series_cache.move_to_end(key)
+        return cached
+
+
+def _cache_put(key, cached):
+    with _locks_guard:
+        _series_cache[key] = cached
+        _series_cache.move_to_end(key)
+        while len(_series_cache) > MAX_CACHED_SERIES:
+            _series_cache.popitem(last=False)
+
+
+def _write_atomic(path: str, text: str):
+    """Write ``text`` to ``path`` through a temp file so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _indicator_request(indicator: str, interval: str, time_period: int, series_type: str):
+    """Return the ``(function, params)`` of the request backing an indicator."""
+    function_name, fixed_period = INDICATOR_FUNCTIONS[indicator]
+    params = {"interval": interval, "datatype": "csv"}
+    if function_name != "MACD":
+        params["time_period"] = fixed_period or str(time_period)
+    if function_name != "ATR":
+        params["series_type"] = series_type
+    return function_name, params
+
+
+def _parse_series(data: str):
+    """Parse an indicator CSV into ``(header, sorted dates, {column: values})``."""
+    lines = data.strip().split('\n')
+    if len(lines) < 2:
+        return None
+    header = [col.strip() for col in lines[0].split(',')]
+    if 'time' not in header:
+        return None
+    date_col_idx = header.index('time')
+
+    rows = []
+    for line in lines[1:]:
+        values = [v.strip() for v in line.split(',')]
+        if len(values) != len(header):
+            continue
+        try:
+            _datetime.strptime(values[date_col_idx], "%Y-%m-%d")
+        except ValueError:
+            continue
+        rows.append(values)
+    rows.sort(key=lambda r: r[date_col_idx])
+
+    dates = [r[date_col_idx] for r in rows]
+    columns = {
+        name: [r[idx] for r in rows] for idx, name in enumerate(header) if idx != date_col_idx
+    }
+    return header, dates, columns
+
+
+def _get_indicator_series(symbol: str, function_name: str, params: dict, curr_date: str):
+    """Return the parsed full history for ``(symbol, function, params)``.
+
+    Alpha Vantage returns the whole history for technical indicators, so one
+    response serves every later window. The response is kept in memory and under
+    ``data_cache_dir/alpha_vantage_indicators``. It is reused while it covers
+    ``curr_date``, or when it was fetched on or after ``curr_date`` (no newer data
+    exists yet). Concurrent requests for the same series wait for one download.
+    """
+    param_key = json.dumps(params, sort_keys=True)
+    key = (symbol, function_name, param_key)
+
+    with _series_lock(key):
+        cached = _cache_get(key)
+
+        cache_dir = os.path.join(get_config()["data_cache_dir"], "alpha_vantage_indicators")
+        digest = hashlib.sha1(param_key.encode("utf-8")).hexdigest()[:12]
+        base_path = os.path.join(cache_dir, f"{symbol}-{function_name}-{digest}")
+
+        if cached is None and os.path.exists(base_path + ".json"):
+            with open(base_path + ".json", "r") as f:
+                meta = json.load(f)
+            with open(base_path + ".csv", "r") as f:
+                series = _parse_series(f.read())
+            if series is not None:
+                cached = (meta["fetched_on"], series)
+                _cache_put(key, cached)
+
+        if cached is not None:
+            fetched_on, series = cached
+            dates = series[1]
+            if (dates and dates[-1] >= curr_date) or fetched_on >= curr_date:
+                return series
+
+        data = _make_api_request(function_name, {"symbol": symbol, **params})
+        series = _parse_series(data)
+        if series is None:
+            # Error payloads are never cached
+            return None
+
+        fetched_on = _datetime.now().strftime("%Y-%m-%d")
+        os.makedirs(cache_dir, exist_ok=True)
+        # The meta file marks the CSV as complete, so it is replaced last
+        _write_atomic(base_path + ".csv", data)
+        _write_atomic(
+            base_path + ".json", json.dumps({"fetched_on": fetched_on, "params": params})
+        )
+
+        _cache_put(key, (fetched_on, series))
+        return series
+
 
 def get_indicator(
     symbol: str,
@@ -73,93 +233,20 @@ def get_indicator(
         series_type = required_series_type
 
     try:
-        # Get indicator data for the period
-        if indicator == "close_50_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "50",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_200_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "200",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_10_ema":
-            data = _make_api_request("EMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "10",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macd":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macds":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macdh":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "rsi":
-            data = _make_api_request("RSI", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator in ["boll", "boll_ub", "boll_lb"]:
-            data = _make_api_request("BBANDS", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "20",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "atr":
-            data = _make_api_request("ATR", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "datatype": "csv"
-            })
-        elif indicator == "vwma":
+        if indicator == "vwma":
             # Alpha Vantage doesn't have direct VWMA, so we'll return an informative message
             # In a real implementation, this would need to be calculated from OHLCV data
             return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{indicator_descriptions.get('vwma', 'No description available.')}"
-        else:
+        if indicator not in INDICATOR_FUNCTIONS:
             return f"Error: Indicator {indicator} not implemented yet."
 
-        # Parse CSV data and extract values for the date range
-        lines = data.strip().split('\n')
-        if len(lines) < 2:
-            return f"Error: No data returned for {indicator}"
+        function_name, params = _indicator_request(indicator, interval, time_period, series_type)
 
-        # Parse header and data
-        header = [col.strip() for col in lines[0].split(',')]
-        try:
-            date_col_idx = header.index('time')
-        except ValueError:
-            return f"Error: 'time' column not found in data for {indicator}. Available columns: {header}"
+        # One full-history response per (symbol, function, params), shared by e.g. macd/macds/macdh
+        series = _get_indicator_series(symbol, function_name, params, curr_date)
+        if series is None:
+            return f"Error: No data returned for {indicator}"
+        header, dates, columns = series
 
         # Map internal indicator names to expected CSV column names from Alpha Vantage
         col_name_map = {
@@ -173,30 +260,16 @@ def get_indicator(
 
         if not target_col_name:
             # Default to the second column if no specific mapping exists
-            value_col_idx = 1
-        else:
-            try:
-                value_col_idx = header.index(target_col_name)
-            except ValueError:
-                return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
-
-        result_data = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            values = line.split(',')
-            if len(values) > value_col_idx:
-                try:
-                    date_str = values[date_col_idx].strip()
-                    # Parse the date
-                    date_dt = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    # Check if date is in our range
-                    if before <= date_dt <= curr_date_dt:
-                        value = values[value_col_idx].strip()
-                        result_data.append((date_dt, value))
-                except (ValueError, IndexError):
-                    continue
+            target_col_name = header[1]
+        elif target_col_name not in columns:
+            return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
+
+        values = columns[target_col_name]
+        lo = bisect.bisect_left(dates, before.strftime("%Y-%m-%d"))
+        hi = bisect.bisect_right(dates, curr_date_dt.strftime("%Y-%m-%d"))
+        result_data = [
+            (datetime.strptime(dates[n], "%Y-%m-%d"), values[n]) for n in range(lo, hi)
+        ]
 
         # Sort by date and format output
         result_data.sort(key=lambda x: x[0])
@@ -1,4 +1,4 @@
-from .alpha_vantage_common import _make_api_request, format_datetime_for_api
+from .alpha_vantage_common import _make_api_request, _amake_api_request, format_datetime_for_api
 from datetime import datetime, timedelta
 
 def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
@@ -15,15 +15,16 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         Dictionary containing news sentiment data or JSON string.
     """
 
-    params = {
+    return _make_api_request("NEWS_SENTIMENT", _news_params(ticker, start_date, end_date))
+
+def _news_params(ticker, start_date, end_date) -> dict:
+    return {
         "tickers": ticker,
         "time_from": format_datetime_for_api(start_date),
         "time_to": format_datetime_for_api(end_date),
         "sort": "LATEST",
         "limit": "50",
     }
-    
-    return _make_api_request("NEWS_SENTIMENT", params)
 
 def get_global_news(curr_date, look_back_days=7, limit=5) -> dict[str, str] | str:
     """Returns global market news & sentiment data.
@@ -38,20 +39,23 @@ def get_global_news(curr_date, look_back_days=7, limit=5) -> dict[str, str] | st
     Returns:
         Dictionary containing global news sentiment data or JSON string.
     """
+    return _make_api_request(
+        "NEWS_SENTIMENT", _global_news_params(curr_date, look_back_days, limit)
+    )
+
+def _global_news_params(curr_date, look_back_days, limit) -> dict:
     # Calculate start date
     curr_date_obj = datetime.strptime(curr_date, "%Y-%m-%d")
     start_date_obj = curr_date_obj - timedelta(days=look_back_days)
     start_date = start_date_obj.strftime("%Y%m%dT%H%M")
     end_date = curr_date_obj.strftime("%Y%m%dT%H%M")
 
-    params = {
+    return {
         "time_from": start_date,
         "time_to": end_date,
         "sort": "LATEST",
         "limit": str(limit),
     }
-    
-    return _make_api_request("NEWS_SENTIMENT", params)
 
 def get_insider_transactions(symbol: str) -> dict[str, str] | str:
     """Returns latest and historical insider transactions by key stakeholders.
@@ -69,4 +73,18 @@ def get_insider_transactions(symbol: str) -> dict[str, str] | str:
         "symbol": symbol,
     }
 
-    return _make_api_request("INSIDER_TRANSACTIONS", params)
\ No newline at end of file
+    return _make_api_request("INSIDER_TRANSACTIONS", params)
+
+async def aget_news(ticker, start_date, end_date) -> dict[str, str] | str:
+    """Async variant of ``get_news``."""
+    return await _amake_api_request("NEWS_SENTIMENT", _news_params(ticker, start_date, end_date))
+
+async def aget_global_news(curr_date, look_back_days=7, limit=5) -> dict[str, str] | str:
+    """Async variant of ``get_global_news``."""
+    return await _amake_api_request(
+        "NEWS_SENTIMENT", _global_news_params(curr_date, look_back_days, limit)
+    )
+
+async def aget_insider_transactions(symbol: str) -> dict[str, str] | str:
+    """Async variant of ``get_insider_transactions``."""
+    return await _amake_api_request("INSIDER_TRANSACTIONS", {"symbol": symbol})
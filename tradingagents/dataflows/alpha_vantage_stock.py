@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime
-from .alpha_vantage_common import _make_api_request, _filter_csv_by_date_range
+from .alpha_vantage_common import _make_api_request, _amake_api_request, _filter_csv_by_date_range
 
 def get_stock(
     symbol: str,
@@ -18,6 +19,11 @@ def get_stock(
     Returns:
         CSV string containing the daily adjusted time series data filtered to the date range.
     """
+    response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", _stock_params(symbol, start_date))
+
+    return _filter_csv_by_date_range(response, start_date, end_date)
+
+def _stock_params(symbol: str, start_date: str) -> dict:
     # Parse dates to determine the range
     start_dt = datetime.strptime(start_date, "%Y-%m-%d")
     today = datetime.now()
@@ -27,12 +33,18 @@ def get_stock(
     days_from_today_to_start = (today - start_dt).days
     outputsize = "compact" if days_from_today_to_start < 100 else "full"
 
-    params = {
+    return {
         "symbol": symbol,
         "outputsize": outputsize,
         "datatype": "csv",
     }
 
-    response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", params)
+async def aget_stock(
+    symbol: str,
+    start_date: str,
+    end_date: str
+) -> str:
+    """Async variant of ``get_stock``; the CSV filtering runs in a worker thread."""
+    response = await _amake_api_request("TIME_SERIES_DAILY_ADJUSTED", _stock_params(symbol, start_date))
 
-    return _filter_csv_by_date_range(response, start_date, end_date)
\ No newline at end of file
+    return await asyncio.to_thread(_filter_csv_by_date_range, response, start_date, end_date)
@@ -0,0 +1,82 @@
+import threading
+from typing import Dict, Optional
+
+from .config import get_config
+
+
+class DateContextRegistry:
+    """Ticker-independent context shared by every run on the same trade date.
+
+    A batch driver fills it once per date with the global news payload and,
+    optionally, a macro digest of it. The ``get_global_news`` tool then answers
+    from the registry, and the news analyst reads the shared context instead of
+    calling the tool itself, so a universe of tickers on one date fetches and
+    summarizes the macro news once. The driver clears its dates when the batch
+    is done, and readers go through ``get_shared_context`` and
+    ``get_shared_global_news``, which ignore the registry unless
+    ``share_global_news`` is enabled.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._contexts: Dict[str, dict] = {}
+
+    def set(
+        self,
+        trade_date: str,
+        global_news: str,
+        look_back_days: int = 7,
+        limit: int = 5,
+        digest: Optional[str] = None,
+    ):
+        with self._lock:
+            self._contexts[str(trade_date)] = {
+                "global_news": global_news,
+                "look_back_days": look_back_days,
+                "limit": limit,
+                "digest": digest,
+            }
+
+    def get(self, trade_date: str) -> Optional[dict]:
+        with self._lock:
+            return self._contexts.get(str(trade_date))
+
+    def global_news(self, curr_date: str, look_back_days: int, limit: int) -> Optional[str]:
+        """Return the stored payload if it was fetched with the same arguments."""
+        context = self.get(curr_date)
+        if (
+            context is None
+            or context["look_back_days"] != look_back_days
+            or context["limit"] != limit
+        ):
+            return None
+        return context["global_news"]
+
+    def clear(self, trade_date: Optional[str] = None):
+        with self._lock:
+            if trade_date is None:
+                self._contexts.clear()
+            else:
+                self._contexts.pop(str(trade_date), None)
+
+
+_registry = DateContextRegistry()
+
+
+def get_date_context_registry() -> DateContextRegistry:
+    """Return the process-wide registry."""
+    return _registry
+
+
+def get_shared_context(trade_date: str) -> Optional[dict]:
+    """Return a date's shared context, or ``None`` when sharing is disabled."""
+    if not get_config().get("share_global_news", True):
+        return None
+    return _registry.get(trade_date)
+
+
+def get_shared_global_news(curr_date: str, look_back_days: int, limit: int) -> Optional[str]:
+    """Return the shared global news payload, or ``None`` when sharing is disabled."""
+    if not get_config().get("share_global_news", True):
+        return None
+    return _registry.global_news(curr_date, look_back_days, limit)
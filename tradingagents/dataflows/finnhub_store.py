@@ -0,0 +1,132 @@
+import os
+import json
+import bisect
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class FinnhubStore:
+    """Pre-indexed store for the processed Finnhub ``*_data_formatted.json`` files.
+
+    Each JSON file is converted once into a pickle holding its non-empty date keys
+    in sorted order next to their entries, so a date range is two bisects and a
+    slice instead of a full ``json.load`` and key scan. The pickle is rebuilt
+    whenever the source JSON changes on disk. Loaded files stay in an LRU cache
+    keyed by ``(path, mtime)`` across calls.
+    """
+
+    def __init__(self, data_dir: str, store_dir: str, max_cached: int = 64):
+        self.data_dir = data_dir
+        self.store_dir = store_dir
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[List[str], List[list]]]" = OrderedDict()
+
+    def source_path(
+        self, ticker: str, data_type: str, period: Optional[str] = None
+    ) -> str:
+        if period:
+            file_name = f"{ticker}_{period}_data_formatted.json"
+        else:
+            file_name = f"{ticker}_data_formatted.json"
+        return os.path.join(self.data_dir, "finnhub_data", data_type, file_name)
+
+    def load(
+        self, ticker: str, data_type: str, period: Optional[str] = None
+    ) -> Tuple[List[str], List[list]]:
+        """Return ``(sorted dates, entries per date)``, building the store if needed."""
+        json_path = self.source_path(ticker, data_type, period)
+        stat = os.stat(json_path)
+        cache_key = (json_path, stat.st_mtime_ns)
+        source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+
+            store_path = os.path.join(
+                self.store_dir,
+                data_type,
+                os.path.basename(json_path).replace(".json", ".pkl"),
+            )
+            table = self._read(store_path, source)
+            if table is None:
+                print(f"DEBUG: Building Finnhub store for {ticker} from: {json_path}")
+                table = self._build(json_path, store_path, source)
+
+            self._cache[cache_key] = table
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+            return table
+
+    def get_range(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        data_type: str,
+        period: Optional[str] = None,
+    ) -> Dict[str, list]:
+        """Return the non-empty entries dated in ``[start_date, end_date]``, by date."""
+        dates, values = self.load(ticker, data_type, period)
+        lo = bisect.bisect_left(dates, start_date)
+        hi = bisect.bisect_right(dates, end_date)
+        return dict(zip(dates[lo:hi], values[lo:hi]))
+
+    def _read(self, store_path: str, source: dict) -> Optional[Tuple[List[str], List[list]]]:
+        if not os.path.exists(store_path):
+            return None
+        with open(store_path, "rb") as f:
+            stored = pickle.load(f)
+        if stored["source"] != source:
+            return None
+        return stored["dates"], stored["values"]
+
+    def _build(
+        self, json_path: str, store_path: str, source: dict
+    ) -> Tuple[List[str], List[list]]:
+        with open(json_path, "r") as f:
+            data = json.load(f)
+
+        items = sorted((key, value) for key, value in data.items() if len(value) > 0)
+        dates = [key for key, _ in items]
+        values = [value for _, value in items]
+
+        os.makedirs(os.path.dirname(store_path), exist_ok=True)
+        tmp_path = store_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"source": source, "dates": dates, "values": values},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, store_path)
+        return dates, values
+
+
+def unique_entries(entries: Iterable[dict]) -> List[dict]:
+    """Drop duplicate entries in one pass, keeping the first occurrence."""
+    seen = set()
+    unique = []
+    for entry in entries:
+        key = json.dumps(entry, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            unique.append(entry)
+    return unique
+
+
+_stores: Dict[Tuple[str, str], FinnhubStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_finnhub_store(data_dir: str, store_dir: str) -> FinnhubStore:
+    """Return the process-wide store for a data directory."""
+    key = (os.path.abspath(data_dir), os.path.abspath(store_dir))
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = FinnhubStore(data_dir, store_dir)
+        return _stores[key]
@@ -0,0 +1,110 @@
+import os
+import time
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Annotated, Dict, Iterable, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+
+# bundle entry -> yf.Ticker attribute
+STATEMENTS = {
+    "balance_sheet": "balance_sheet",
+    "quarterly_balance_sheet": "quarterly_balance_sheet",
+    "cashflow": "cashflow",
+    "quarterly_cashflow": "quarterly_cashflow",
+    "income_stmt": "income_stmt",
+    "quarterly_income_stmt": "quarterly_income_stmt",
+    "insider_transactions": "insider_transactions",
+}
+
+_bundles: Dict[str, dict] = {}
+_symbol_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _symbol_lock(symbol: str) -> threading.Lock:
+    """Return the lock serializing bundle fetches for a symbol."""
+    with _locks_guard:
+        return _symbol_locks.setdefault(symbol, threading.Lock())
+
+
+def _fetch_statement(symbol: str, attribute: str) -> Optional[pd.DataFrame]:
+    # One Ticker per worker so concurrent scrapes share no lazily built state
+    return getattr(yf.Ticker(symbol), attribute)
+
+
+def _fetch_statements(symbol: str, names: Iterable[str], bundle: dict):
+    """Fetch ``names`` concurrently into ``bundle``, recording failures per statement."""
+    names = list(names)
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        futures = {
+            name: executor.submit(_fetch_statement, symbol, STATEMENTS[name])
+            for name in names
+        }
+        for name, future in futures.items():
+            try:
+                bundle["statements"][name] = future.result()
+                bundle["errors"].pop(name, None)
+            except Exception as e:
+                bundle["statements"][name] = None
+                bundle["errors"][name] = str(e)
+    bundle["retrieved_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def get_fundamentals_bundle(
+    ticker: Annotated[str, "ticker symbol of the company"],
+) -> dict:
+    """Return every yfinance statement of a ticker from one snapshot.
+
+    All annual and quarterly statements and the insider transactions are fetched
+    concurrently on first use, then served from memory and from a pickle under
+    ``data_cache_dir/fundamentals`` for ``fundamentals_cache_ttl`` seconds, so new
+    filings show up within that time. Concurrent callers for the same ticker wait
+    for a single fetch. A statement that fails is recorded in ``errors``, never
+    persisted, and refetched on the next call; use ``get_statement`` to read one.
+    """
+    symbol = ticker.upper()
+    ttl = get_config().get("fundamentals_cache_ttl", 86400)
+    cache_dir = os.path.join(get_config()["data_cache_dir"], "fundamentals")
+    bundle_path = os.path.join(cache_dir, f"{symbol}.pkl")
+
+    with _symbol_lock(symbol):
+        bundle = _bundles.get(symbol)
+        if bundle is None and os.path.exists(bundle_path):
+            with open(bundle_path, "rb") as f:
+                bundle = pickle.load(f)
+        if bundle is not None and time.time() - bundle["fetched_at"] >= ttl:
+            bundle = None
+
+        if bundle is None:
+            print(f"DEBUG: Fetching fundamentals bundle for {symbol}")
+            bundle = {"symbol": symbol, "fetched_at": time.time(), "statements": {}, "errors": {}}
+            _fetch_statements(symbol, STATEMENTS, bundle)
+        elif bundle["errors"]:
+            print(f"DEBUG: Refetching failed statements for {symbol}: {list(bundle['errors'])}")
+            _fetch_statements(symbol, list(bundle["errors"]), bundle)
+        else:
+            _bundles[symbol] = bundle
+            return bundle
+
+        if not bundle["errors"]:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = bundle_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, bundle_path)
+
+        _bundles[symbol] = bundle
+        return bundle
+
+
+def get_statement(bundle: dict, name: str) -> Optional[pd.DataFrame]:
+    """Return one statement of a bundle, raising the error if its fetch failed."""
+    if name in bundle["errors"]:
+        raise RuntimeError(bundle["errors"][name])
+    return bundle["statements"][name]
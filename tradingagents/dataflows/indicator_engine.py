@@ -0,0 +1,257 @@
+import os
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Annotated, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .numpy_indicators import (
+    IndicatorState,
+    compute_indicators,
+    compute_with_stockstats,
+    has_missing_prices,
+)
+
+
+class IndicatorTable:
+    """All supported indicators for one symbol, stored as NumPy columns on a date index."""
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        state: Optional[IndicatorState] = None,
+    ):
+        self.dates = dates
+        self.columns = columns
+        self.state = state
+
+    def save(self, path: str):
+        """Write the table and its recursive state to an ``.npz`` snapshot.
+
+        Each writer uses its own temporary file, so concurrent saves (also from
+        other processes) never interleave and the snapshot is replaced atomically.
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp.npz"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    dates=self.dates,
+                    state=np.array(self.state.to_json() if self.state else ""),
+                    **{f"col_{name}": values for name, values in self.columns.items()},
+                )
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional["IndicatorTable"]:
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as snapshot:
+            state_json = str(snapshot["state"])
+            return cls(
+                snapshot["dates"],
+                {
+                    key[len("col_"):]: snapshot[key]
+                    for key in snapshot.files
+                    if key.startswith("col_")
+                },
+                IndicatorState.from_json(state_json) if state_json else None,
+            )
+
+    def window(
+        self,
+        indicator: Annotated[str, "technical indicator name"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    ) -> Dict[str, str]:
+        """Return ``{date: value}`` for the trading days in the window (inclusive)."""
+        lo = np.searchsorted(self.dates, np.datetime64(start_date, "D"), side="left")
+        hi = np.searchsorted(self.dates, np.datetime64(end_date, "D"), side="right")
+
+        dates = np.datetime_as_string(self.dates[lo:hi], unit="D")
+        values = self.columns[indicator][lo:hi]
+
+        return {
+            date: "N/A" if np.isnan(value) else str(value)
+            for date, value in zip(dates, values.tolist())
+        }
+
+
+class IndicatorEngine:
+    """Process-wide cache of indicator tables keyed by ``(symbol, data version)``.
+
+    The first request for a symbol loads its price history once and computes every
+    supported indicator in one pass. Later requests for any indicator or date window
+    are served from memory. The least recently used tables are evicted once more than
+    ``max_entries`` are held.
+
+    ``backend`` selects how the indicators are computed: ``"numpy"`` for the
+    vectorized implementations in ``numpy_indicators`` or ``"stockstats"``.
+
+    When the price history of a symbol grows by a few bars (a new trading day was
+    appended to the cache), the new table is derived from the previous one by
+    stepping its ``IndicatorState`` once per new bar instead of recomputing the
+    whole history. Passing ``snapshot_path`` persists the table and state so this
+    also works across processes.
+    """
+
+    BACKENDS = {
+        "numpy": compute_indicators,
+        "stockstats": compute_with_stockstats,
+    }
+
+    def __init__(
+        self, indicators: Iterable[str], max_entries: int = 32, backend: str = "numpy"
+    ):
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown indicator backend '{backend}'. Choose from: {list(self.BACKENDS)}"
+            )
+        self.indicators = tuple(indicators)
+        self.max_entries = max_entries
+        self.backend = backend
+        self._entries: "OrderedDict[Tuple[str, Hashable], IndicatorTable]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes compute and snapshot writes per symbol; _lock only guards the dicts
+        self._symbol_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+    def get_table(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        version: Annotated[Hashable, "identifies the price data the table was built from"],
+        loader: Callable[[], pd.DataFrame],
+        snapshot_path: Optional[str] = None,
+    ) -> IndicatorTable:
+        """Return the cached table for ``(symbol, version)``, computing it on a miss.
+
+        Concurrent misses for the same symbol wait for a single computation.
+        """
+        key = (symbol, version)
+        with self._lock:
+            table = self._lookup(key)
+            if table is not None:
+                return table
+            symbol_lock = self._symbol_locks[symbol]
+
+        with symbol_lock:
+            with self._lock:
+                # Another caller may have built it while we waited
+                table = self._lookup(key)
+                if table is not None:
+                    return table
+                previous = next(
+                    (t for (sym, _), t in reversed(self._entries.items()) if sym == symbol),
+                    None,
+                )
+
+            data = self._prepare(loader())
+            if previous is None and snapshot_path:
+                previous = self._load_snapshot(snapshot_path)
+
+            table = self.extend(previous, data) if previous is not None else None
+            if table is None:
+                table = self.compute(data)
+            if snapshot_path and table is not previous:
+                table.save(snapshot_path)
+
+            with self._lock:
+                self._entries[key] = table
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return table
+
+    def _lookup(self, key) -> Optional[IndicatorTable]:
+        table = self._entries.get(key)
+        if table is not None:
+            self._entries.move_to_end(key)
+        return table
+
+    @staticmethod
+    def _load_snapshot(snapshot_path: str) -> Optional[IndicatorTable]:
+        try:
+            return IndicatorTable.load(snapshot_path)
+        except Exception as e:
+            # A damaged snapshot is only a lost shortcut; recompute and overwrite it
+            print(f"WARNING: Ignoring unreadable indicator snapshot {snapshot_path}: {e}")
+            return None
+
+    @staticmethod
+    def _prepare(data: pd.DataFrame) -> pd.DataFrame:
+        data = data.copy()
+        data["Date"] = pd.to_datetime(data["Date"].astype(str).str[:10])
+        return data.sort_values("Date", kind="mergesort").reset_index(drop=True)
+
+    def compute(self, data: pd.DataFrame) -> IndicatorTable:
+        """Compute every supported indicator for a price history frame."""
+        data = self._prepare(data)
+        dates = data["Date"].values.astype("datetime64[D]")
+
+        columns = self.BACKENDS[self.backend](data, self.indicators)
+        # The O(1) recursions cannot skip missing prices; such tables are recomputed
+        state = None if has_missing_prices(data) else IndicatorState.from_history(data)
+        return IndicatorTable(dates, columns, state)
+
+    def extend(self, previous: IndicatorTable, data: pd.DataFrame) -> Optional[IndicatorTable]:
+        """Derive the table for ``data`` from ``previous`` if ``data`` only appends bars.
+
+        Returns ``None`` when ``previous`` is not a prefix of ``data``, so the caller
+        recomputes. Besides the dates, the last close ``previous`` was built on must
+        still match, which catches a split/dividend re-adjustment of the history.
+        """
+        data = self._prepare(data)
+        dates = data["Date"].values.astype("datetime64[D]")
+        n_old = len(previous.dates)
+
+        if (
+            previous.state is None
+            or n_old == 0
+            or len(dates) < n_old
+            or dates[n_old - 1] != previous.dates[-1]
+            or set(previous.columns) != set(self.indicators)
+        ):
+            return None
+
+        lowered = {str(col).lower(): col for col in data.columns}
+        state_closes = previous.state.values["tails"]["close"]
+        if not state_closes or not np.isclose(
+            float(data[lowered["close"]].iloc[n_old - 1]), state_closes[-1], rtol=1e-6
+        ):
+            return None
+        if len(dates) == n_old:
+            return previous
+
+        new_rows = data.iloc[n_old:]
+        if has_missing_prices(new_rows):
+            return None
+
+        state = IndicatorState.from_json(previous.state.to_json())
+        new_values = {name: [] for name in self.indicators}
+        for high, low, close, volume in zip(
+            new_rows[lowered["high"]].astype(float),
+            new_rows[lowered["low"]].astype(float),
+            new_rows[lowered["close"]].astype(float),
+            new_rows[lowered["volume"]].astype(float),
+        ):
+            bar = state.update(high, low, close, volume)
+            for name in self.indicators:
+                new_values[name].append(bar[name])
+
+        columns = {
+            name: np.concatenate([previous.columns[name], np.asarray(new_values[name])])
+            for name in self.indicators
+        }
+        return IndicatorTable(dates, columns, state)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,3 +1,8 @@
+import re
+import time
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Annotated
 
 # Import from vendor-specific modules
@@ -14,12 +19,21 @@ from .alpha_vantage import (
     get_income_statement as get_alpha_vantage_income_statement,
     get_insider_transactions as get_alpha_vantage_insider_transactions,
     get_news as get_alpha_vantage_news,
-    get_global_news as get_alpha_vantage_global_news
+    get_global_news as get_alpha_vantage_global_news,
+    aget_stock as aget_alpha_vantage_stock,
+    aget_fundamentals as aget_alpha_vantage_fundamentals,
+    aget_balance_sheet as aget_alpha_vantage_balance_sheet,
+    aget_cashflow as aget_alpha_vantage_cashflow,
+    aget_income_statement as aget_alpha_vantage_income_statement,
+    aget_news as aget_alpha_vantage_news,
+    aget_global_news as aget_alpha_vantage_global_news,
+    aget_insider_transactions as aget_alpha_vantage_insider_transactions,
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
 
 # Configuration and routing logic
 from .config import get_config
+from .response_cache import get_response_cache
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -118,6 +132,19 @@ VENDOR_METHODS = {
     },
 }
 
+# Native coroutines for vendor implementations that have one; every other
+# implementation is run in a worker thread by the async router
+ASYNC_VENDOR_METHODS = {
+    get_alpha_vantage_stock: aget_alpha_vantage_stock,
+    get_alpha_vantage_fundamentals: aget_alpha_vantage_fundamentals,
+    get_alpha_vantage_balance_sheet: aget_alpha_vantage_balance_sheet,
+    get_alpha_vantage_cashflow: aget_alpha_vantage_cashflow,
+    get_alpha_vantage_income_statement: aget_alpha_vantage_income_statement,
+    get_alpha_vantage_news: aget_alpha_vantage_news,
+    get_alpha_vantage_global_news: aget_alpha_vantage_global_news,
+    get_alpha_vantage_insider_transactions: aget_alpha_vantage_insider_transactions,
+}
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
     for category, info in TOOLS_CATEGORIES.items():
@@ -140,11 +167,187 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
+_vendor_slots = None
+_vendor_slots_lock = threading.Lock()
+
+def _get_vendor_slots() -> threading.Semaphore:
+    """Return the semaphore bounding concurrent vendor calls to ``vendor_max_workers``."""
+    global _vendor_slots
+    with _vendor_slots_lock:
+        if _vendor_slots is None:
+            _vendor_slots = threading.Semaphore(get_config().get("vendor_max_workers", 8))
+        return _vendor_slots
+
+def _start_call(impl_func, args: tuple, kwargs: dict, timeout: float) -> Future:
+    """Start one vendor call on its own thread as soon as a slot is free.
+
+    The slot is given back when the call returns or after ``timeout`` seconds,
+    whichever comes first. A hung call keeps only its own thread, so it cannot
+    starve later calls, and waiting for a slot never takes longer than ``timeout``.
+    """
+    slots = _get_vendor_slots()
+    slots.acquire()
+    released = threading.Lock()
+
+    def release():
+        # Called by the timer and by the call itself; only the first one counts
+        if released.acquire(blocking=False):
+            slots.release()
+
+    timer = threading.Timer(timeout, release)
+    timer.daemon = True
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run():
+        try:
+            future.set_result(impl_func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            timer.cancel()
+            release()
+
+    timer.start()
+    threading.Thread(target=run, name="vendor-call", daemon=True).start()
+    return future
+
+def _vendor_calls(method: str, vendors: list) -> list:
+    """Expand vendors into ``(vendor, implementation)`` pairs, in vendor order."""
+    calls = []
+    for vendor in vendors:
+        vendor_impl = VENDOR_METHODS[method][vendor]
+        if isinstance(vendor_impl, list):
+            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_impl)} functions")
+            impls = vendor_impl
+        else:
+            impls = [vendor_impl]
+        for impl_func in impls:
+            print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor}'...")
+            calls.append((vendor, impl_func))
+    return calls
+
+def _collect_results(vendors: list, calls: list, outcomes: list, timeout: float) -> tuple:
+    """Log each call's outcome (a result or an exception) and keep the successes.
+
+    Returns ``(results, complete)``; ``complete`` is False if any call failed.
+    """
+    results = []
+    vendor_results = {vendor: 0 for vendor in vendors}
+    for (vendor, impl_func), outcome in zip(calls, outcomes):
+        if isinstance(outcome, (FutureTimeoutError, asyncio.TimeoutError)):
+            # The worker cannot be interrupted; its late result is discarded
+            print(f"FAILED: {impl_func.__name__} from vendor '{vendor}' timed out after {timeout}s")
+        elif isinstance(outcome, AlphaVantageRateLimitError):
+            print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
+            print(f"DEBUG: Rate limit details: {outcome}")
+        elif isinstance(outcome, BaseException):
+            # Log error but keep the results of the other implementations
+            print(f"FAILED: {impl_func.__name__} from vendor '{vendor}' failed: {outcome}")
+        else:
+            results.append(outcome)
+            vendor_results[vendor] += 1
+            print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor}' completed successfully")
+
+    for vendor, count in vendor_results.items():
+        if count:
+            print(f"SUCCESS: Vendor '{vendor}' succeeded - Got {count} result(s)")
+        else:
+            print(f"FAILED: Vendor '{vendor}' produced no results")
+    return results, len(results) == len(calls)
+
+def _run_vendors(method: str, vendors: list, args: tuple, kwargs: dict) -> tuple:
+    """Run every implementation of the given vendors concurrently.
+
+    Each implementation gets ``vendor_timeout`` seconds from the moment it starts.
+    At most ``vendor_max_workers`` calls run at once; a call that times out is
+    abandoned (it cannot be interrupted) and frees its slot. Results are returned
+    in vendor order, then implementation order, regardless of completion order.
+    """
+    timeout = get_config().get("vendor_timeout", 60)
+
+    calls = _vendor_calls(method, vendors)
+    started = []
+    for _, impl_func in calls:
+        future = _start_call(impl_func, args, kwargs, timeout)
+        started.append((future, time.monotonic()))
+
+    outcomes = []
+    for future, started_at in started:
+        try:
+            remaining = started_at + timeout - time.monotonic()
+            outcomes.append(future.result(timeout=max(0.0, remaining)))
+        except Exception as e:
+            outcomes.append(e)
+    return _collect_results(vendors, calls, outcomes, timeout)
+
+async def _to_thread_timed(impl_func, args: tuple, kwargs: dict, timeout: float):
+    """Run a blocking call like ``_run_vendors`` does, awaiting it on the event loop."""
+    # Waiting for a slot blocks, so do it off the loop
+    future = await asyncio.to_thread(_start_call, impl_func, args, kwargs, timeout)
+    return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+async def _arun_vendors(method: str, vendors: list, args: tuple, kwargs: dict) -> tuple:
+    """Async variant of ``_run_vendors``.
+
+    Implementations with a native coroutine in ``ASYNC_VENDOR_METHODS`` are awaited
+    directly. Blocking ones (pandas, yfinance, scraping) run on their own threads
+    under the same slots and timeout as ``_run_vendors``.
+    """
+    timeout = get_config().get("vendor_timeout", 60)
+
+    calls = _vendor_calls(method, vendors)
+    awaitables = []
+    for _, impl_func in calls:
+        async_impl = ASYNC_VENDOR_METHODS.get(impl_func)
+        if async_impl is not None:
+            awaitables.append(asyncio.wait_for(async_impl(*args, **kwargs), timeout))
+        else:
+            awaitables.append(_to_thread_timed(impl_func, args, kwargs, timeout))
+
+    outcomes = await asyncio.gather(*awaitables, return_exceptions=True)
+    return _collect_results(vendors, calls, outcomes, timeout)
+
 def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+    """Route method calls to appropriate vendor implementation with fallback support.
+    Successful results are memoized in the response cache when it is enabled.
+    """
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
 
+    cache = get_response_cache()
+    if cache is None:
+        return _call_vendors(method, vendor_config, *args, **kwargs)
+
+    key = cache.make_key(method, vendor_config, args, kwargs)
+    hit, cached_result = cache.get(method, key)
+    if hit:
+        print(f"CACHE: {method} served from response cache")
+        return cached_result
+
+    result, complete = _call_vendors(method, vendor_config, *args, with_status=True, **kwargs)
+    if _cacheable(result, complete):
+        cache.set(method, key, result, cache.ttl_for(category, args, kwargs))
+    return result
+
+# Vendors report missing data as "", "No data found ..." or "No ... data found ..."
+NO_DATA_PATTERN = re.compile(r"^No (?:[\w ]+ )?data found", re.IGNORECASE)
+
+def _cacheable(result, complete: bool) -> bool:
+    """Only a result every implementation produced, with data, is worth caching.
+
+    Partial joins (an implementation failed or timed out), empty payloads, no-data
+    messages and "Error ..." strings may change on the next call and are never stored.
+    """
+    if not complete or result is None:
+        return False
+    if isinstance(result, str):
+        text = result.strip()
+        return bool(text) and not text.startswith("Error") and not NO_DATA_PATTERN.match(text)
+    return True
+
+def _plan_vendors(method: str, vendor_config: str):
+    """Return ``(primary vendors, fallback vendors)`` supported for a method."""
     # Handle comma-separated vendors
     primary_vendors = [v.strip() for v in vendor_config.split(',')]
 
@@ -165,72 +368,20 @@ def route_to_vendor(method: str, *args, **kwargs):
     fallback_str = " → ".join(fallback_vendors)
     print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
 
-    # Track results and execution state
-    results = []
-    vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
-
-    for vendor in fallback_vendors:
-        if vendor not in VENDOR_METHODS[method]:
-            if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
-            continue
-
-        vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
-
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
-
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
-
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
-        else:
-            vendor_methods = [(vendor_impl, vendor)]
-
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
-
-        # Add this vendor's results
-        if vendor_results:
-            results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
-            # Stopping logic: Stop after first successful vendor for single-vendor configs
-            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
-            if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
-                break
+    supported_primaries = []
+    for vendor in primary_vendors:
+        if vendor in VENDOR_METHODS[method]:
+            supported_primaries.append(vendor)
         else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
+            print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
+
+    fallbacks = [
+        vendor for vendor in fallback_vendors
+        if vendor not in primary_vendors and vendor in VENDOR_METHODS[method]
+    ]
+    return supported_primaries, fallbacks
 
+def _finish(method: str, results: list, vendor_attempt_count: int):
     # Final result summary
     if not results:
         print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
@@ -243,4 +394,72 @@ def route_to_vendor(method: str, *args, **kwargs):
         return results[0]
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        return '\n'.join(str(result) for result in results)
+
+async def aroute_to_vendor(method: str, *args, **kwargs):
+    """Async variant of ``route_to_vendor`` for use on an event loop."""
+    category = get_category_for_method(method)
+    vendor_config = get_vendor(category, method)
+
+    cache = get_response_cache()
+    if cache is None:
+        return await _acall_vendors(method, vendor_config, *args, **kwargs)
+
+    key = cache.make_key(method, vendor_config, args, kwargs)
+    hit, cached_result = await asyncio.to_thread(cache.get, method, key)
+    if hit:
+        print(f"CACHE: {method} served from response cache")
+        return cached_result
+
+    result, complete = await _acall_vendors(method, vendor_config, *args, with_status=True, **kwargs)
+    if _cacheable(result, complete):
+        await asyncio.to_thread(
+            cache.set, method, key, result, cache.ttl_for(category, args, kwargs)
+        )
+    return result
+
+def _call_vendors(method: str, vendor_config: str, *args, with_status: bool = False, **kwargs):
+    """Call the configured vendors for a method, falling back on failure.
+
+    With ``with_status``, returns ``(result, complete)`` where ``complete`` tells
+    whether every implementation of the answering vendors succeeded.
+    """
+    # Primary vendors (and all of their implementations) run concurrently.
+    # Remaining vendors are only tried, one at a time, if every primary fails.
+    primaries, fallbacks = _plan_vendors(method, vendor_config)
+
+    vendor_attempt_count = len(primaries)
+    print(f"DEBUG: Attempting PRIMARY vendor(s) {primaries} for {method} in parallel")
+    results, complete = _run_vendors(method, primaries, args, kwargs)
+
+    if not results:
+        for vendor in fallbacks:
+            vendor_attempt_count += 1
+            print(f"DEBUG: Attempting FALLBACK vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+            results, complete = _run_vendors(method, [vendor], args, kwargs)
+            if results:
+                print(f"DEBUG: Stopping after successful vendor '{vendor}'")
+                break
+
+    result = _finish(method, results, vendor_attempt_count)
+    return (result, complete) if with_status else result
+
+async def _acall_vendors(method: str, vendor_config: str, *args, with_status: bool = False, **kwargs):
+    """Async variant of ``_call_vendors``."""
+    primaries, fallbacks = _plan_vendors(method, vendor_config)
+
+    vendor_attempt_count = len(primaries)
+    print(f"DEBUG: Attempting PRIMARY vendor(s) {primaries} for {method} concurrently")
+    results, complete = await _arun_vendors(method, primaries, args, kwargs)
+
+    if not results:
+        for vendor in fallbacks:
+            vendor_attempt_count += 1
+            print(f"DEBUG: Attempting FALLBACK vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+            results, complete = await _arun_vendors(method, [vendor], args, kwargs)
+            if results:
+                print(f"DEBUG: Stopping after successful vendor '{vendor}'")
+                break
+
+    result = _finish(method, results, vendor_attempt_count)
+    return (result, complete) if with_status else result
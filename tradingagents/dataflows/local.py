@@ -1,12 +1,16 @@
 from typing import Annotated
 import pandas as pd
 import os
-from .config import DATA_DIR
+from .config import DATA_DIR, get_config
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import json
-from .reddit_utils import fetch_top_from_category
-from tqdm import tqdm
+import threading
+from collections import OrderedDict
+from .reddit_utils import fetch_top_from_category_multi, fetch_top_from_category_range
+from .price_store import get_price_store
+from .finnhub_store import get_finnhub_store, unique_entries
+from .simfin_store import get_simfin_store
 
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -55,56 +59,23 @@ def get_YFin_data(
 ) -> str:
     """
     Read stock data from local CSV files. Automatically searches for matching CSV files
-    in the market_data/price_data directory.
+    in the market_data/price_data directory. The CSV is converted once into a columnar
+    store under data_cache_dir, so each call is a binary search plus a slice.
     """
     price_data_dir = os.path.join(DATA_DIR, "market_data/price_data")
-    
-    # Check if the directory exists
-    if not os.path.exists(price_data_dir):
-        raise FileNotFoundError(f"Price data directory not found: {price_data_dir}")
-    
-    # Search for CSV files matching the symbol
-    matching_files = []
-    for filename in os.listdir(price_data_dir):
-        if filename.startswith(f"{symbol}-") and filename.endswith(".csv"):
-            matching_files.append(filename)
-    
-    if not matching_files:
-        raise FileNotFoundError(
-            f"No local data file found for symbol '{symbol}' in {price_data_dir}. "
-            f"Expected format: {symbol}-YFin-data-YYYY-MM-DD-YYYY-MM-DD.csv"
-        )
-    
-    # Use the first matching file (or implement logic to choose the best match)
-    csv_file = matching_files[0]
-    csv_path = os.path.join(price_data_dir, csv_file)
-    
-    print(f"DEBUG: Loading local data from: {csv_file}")
-    
-    # Read in data (skip comment lines starting with #)
-    data = pd.read_csv(csv_path, comment='#')
-    
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-    
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-    
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
-    
+    store = get_price_store(
+        price_data_dir, os.path.join(get_config()["data_cache_dir"], "price_store")
+    )
+
+    filtered_data = store.get_range(symbol, start_date, end_date)
+
     # Check if we have data in the requested range
     if filtered_data.empty:
         raise ValueError(
             f"No data available for {symbol} in the date range {start_date} to {end_date}. "
-            f"Local file '{csv_file}' does not contain data for this period."
+            f"Local file '{store.find_source_file(symbol)}' does not contain data for this period."
         )
-    
-    # Remove the index from the dataframe
-    filtered_data = filtered_data.reset_index(drop=True)
-    
+
     return filtered_data
 
 def get_finnhub_news(
@@ -165,12 +136,9 @@ def get_finnhub_company_insider_sentiment(
         return ""
 
     result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    entries = (entry for senti_list in data.values() for entry in senti_list)
+    for entry in unique_entries(entries):
+        result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -203,12 +171,9 @@ def get_finnhub_company_insider_transactions(
 
     result_str = ""
 
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    entries = (entry for senti_list in data.values() for entry in senti_list)
+    for entry in unique_entries(entries):
+        result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -218,7 +183,8 @@ def get_finnhub_company_insider_transactions(
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
     """
-    Gets finnhub data saved and processed on disk.
+    Gets finnhub data saved and processed on disk. Each file is indexed once into a
+    sorted store under data_cache_dir, so a range is a binary search plus a slice.
     Args:
         start_date (str): Start date in YYYY-MM-DD format.
         end_date (str): End date in YYYY-MM-DD format.
@@ -227,27 +193,27 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
     """
 
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
-        )
-
-    data = open(data_path, "r")
-    data = json.load(data)
+    store = get_finnhub_store(
+        data_dir, os.path.join(get_config()["data_cache_dir"], "finnhub_store")
+    )
+    return store.get_range(ticker, start_date, end_date, data_type, period)
 
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+def _latest_simfin_statement(statement_dir, file_prefix, ticker, freq, curr_date):
+    """
+    Latest SimFin statement of a ticker published on or before curr_date, or None.
+    Served from a per-ticker store built once from the US-market CSV.
+    """
+    data_path = os.path.join(
+        DATA_DIR,
+        "fundamental_data",
+        "simfin_data_all",
+        statement_dir,
+        "companies",
+        "us",
+        f"us-{file_prefix}-{freq}.csv",
+    )
+    store = get_simfin_store(os.path.join(get_config()["data_cache_dir"], "simfin_store"))
+    return store.latest_as_of(data_path, ticker, curr_date)
 
 def get_simfin_balance_sheet(
     ticker: Annotated[str, "ticker symbol"],
@@ -257,35 +223,13 @@ def get_simfin_balance_sheet(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    latest_balance_sheet = _latest_simfin_statement("balance_sheet", "balance", ticker, freq, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -304,35 +248,13 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    latest_cash_flow = _latest_simfin_statement("cash_flow", "cashflow", ticker, freq, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -351,35 +273,13 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    latest_income = _latest_simfin_statement("income_statements", "income", ticker, freq, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -409,26 +309,14 @@ def get_reddit_global_news(
     before = curr_date_dt - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from before to curr_date
-    curr_iter_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (curr_date_dt - curr_iter_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {curr_date}", total=total_iterations)
-
-    while curr_iter_date <= curr_date_dt:
-        curr_date_str = curr_iter_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            limit,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_iter_date += relativedelta(days=1)
-        pbar.update(1)
-
-    pbar.close()
+    # One indexed range query instead of a full scan of the dumps per day
+    posts = fetch_top_from_category_range(
+        "global_news",
+        before,
+        curr_date,
+        limit,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+    )
 
     if len(posts) == 0:
         return ""
@@ -443,6 +331,39 @@ def get_reddit_global_news(
     return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
 
 
+# (query, start_date, end_date) -> company news posts tagged by a batch scan
+_shared_company_posts = OrderedDict()
+_SHARED_COMPANY_POSTS_MAX = 1024
+_shared_company_posts_lock = threading.Lock()
+
+
+def prefetch_reddit_company_news(
+    queries: Annotated[list, "Ticker symbols of one batch"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+):
+    """Scan the company news window once for all ``queries`` of a batch.
+
+    Each query's posts are kept until ``get_reddit_company_news`` asks for the same
+    window, which then takes them instead of scanning again. Only the most recent
+    ``_SHARED_COMPANY_POSTS_MAX`` unread entries are kept.
+    """
+    posts = fetch_top_from_category_multi(
+        "company_news",
+        start_date,
+        end_date,
+        10,  # max limit per day
+        list(queries),
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+    )
+    with _shared_company_posts_lock:
+        for query, query_posts in posts.items():
+            _shared_company_posts[(query, start_date, end_date)] = query_posts
+            _shared_company_posts.move_to_end((query, start_date, end_date))
+        while len(_shared_company_posts) > _SHARED_COMPANY_POSTS_MAX:
+            _shared_company_posts.popitem(last=False)
+
+
 def get_reddit_company_news(
     query: Annotated[str, "Search query or ticker symbol"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -458,34 +379,17 @@ def get_reddit_company_news(
         str: A formatted string containing news articles posts on reddit
     """
 
-    start_date_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    end_date_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = start_date_dt
-
-    total_iterations = (end_date_dt - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {query} from {start_date} to {end_date}",
-        total=total_iterations,
-    )
-
-    while curr_date <= end_date_dt:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
+    with _shared_company_posts_lock:
+        posts = _shared_company_posts.pop((query, start_date, end_date), None)
+    if posts is None:
+        posts = fetch_top_from_category_range(
             "company_news",
-            curr_date_str,
+            start_date,
+            end_date,
             10,  # max limit per day
             query,
             data_path=os.path.join(DATA_DIR, "reddit_data"),
         )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
 
     if len(posts) == 0:
         return ""
@@ -497,4 +401,4 @@ def get_reddit_company_news(
         else:
             news_str += f"### {post['title']}\n\n{post['content']}\n\n"
 
-    return f"##{query} News Reddit, from {start_date} to {end_date}:\n\n{news_str}"
\ No newline at end of file
+    return f"##{query} News Reddit, from {start_date} to {end_date}:\n\n{news_str}"
@@ -0,0 +1,423 @@
+"""Vectorized NumPy implementations of the market analyst indicators.
+
+The formulas follow stockstats so the two backends are interchangeable:
+
+- simple moving averages use ``min_periods=1`` and are computed from prefix sums
+- EMAs are pandas' adjusted EWM (``span=N``), evaluated as a first-order IIR filter
+- RSI and ATR use Wilder's smoothing (adjusted EWM with ``alpha=1/N``)
+- Bollinger bands use the sample standard deviation over 20 bars
+- VWMA and MFI are based on the typical price ``(high + low + close) / 3``
+
+The prefix-sum and IIR kernels assume complete prices. pandas skips missing
+values inside its rolling and EWM windows instead, so histories with a missing
+price are computed through stockstats. ``parity_report`` compares both backends
+on one frame; see ``tests/test_numpy_indicators.py``.
+"""
+
+import json
+import time
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # pragma: no cover - scipy is optional
+    lfilter = None
+
+
+SUPPORTED_INDICATORS = (
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+)
+
+MACD_WINDOWS = (12, 26, 9)
+RSI_WINDOW = 14
+ATR_WINDOW = 14
+BOLL_WINDOW = 20
+BOLL_STD_TIMES = 2
+VWMA_WINDOW = 14
+MFI_WINDOW = 14
+
+
+def _decay_filter(x: np.ndarray, decay: float) -> np.ndarray:
+    """Return ``y[t] = x[t] + decay * y[t - 1]`` with ``y[-1] = 0``."""
+    if lfilter is not None:
+        return lfilter([1.0], [1.0, -decay], x)
+
+    out = np.empty_like(x)
+    acc = 0.0
+    for i, value in enumerate(x.tolist()):
+        acc = value + decay * acc
+        out[i] = acc
+    return out
+
+
+def ewm_mean(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Adjusted exponentially weighted mean, identical to ``Series.ewm(alpha=alpha).mean()``."""
+    decay = 1.0 - alpha
+    numerator = _decay_filter(x, decay)
+    # The weight normalizer has the closed form sum(decay^i, i=0..t)
+    denominator = (1.0 - decay ** np.arange(1, len(x) + 1)) / alpha
+    return numerator / denominator
+
+
+def ema(x: np.ndarray, window: int) -> np.ndarray:
+    return ewm_mean(x, 2.0 / (window + 1.0))
+
+
+def smma(x: np.ndarray, window: int) -> np.ndarray:
+    return ewm_mean(x, 1.0 / window)
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum with ``min_periods=1`` computed from a prefix sum."""
+    prefix = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+    out = prefix[1:].copy()
+    out[window:] -= prefix[1:-window]
+    return out
+
+
+def _window_counts(n: int, window: int) -> np.ndarray:
+    return np.minimum(np.arange(1, n + 1), window).astype(np.float64)
+
+
+def sma(x: np.ndarray, window: int) -> np.ndarray:
+    return rolling_sum(x, window) / _window_counts(len(x), window)
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample standard deviation (ddof=1) from prefix sums of x and x**2."""
+    # Centering first keeps the prefix sums small and avoids cancellation
+    centered = x - x.mean() if len(x) else x
+    counts = _window_counts(len(x), window)
+    s1 = rolling_sum(centered, window)
+    s2 = rolling_sum(centered * centered, window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = (s2 - s1 * s1 / counts) / (counts - 1.0)
+    var[counts < 2] = np.nan
+    return np.sqrt(np.maximum(var, 0.0))
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    prev_close = np.empty_like(close)
+    if len(close):
+        prev_close[0] = close[0]
+        prev_close[1:] = close[:-1]
+    tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return np.nan_to_num(tr, copy=False)
+
+
+def rsi(close: np.ndarray, window: int = RSI_WINDOW) -> np.ndarray:
+    diff = np.zeros_like(close)
+    diff[1:] = np.diff(close)
+    up = smma(np.where(diff > 0, diff, 0.0), window)
+    down = smma(np.where(diff < 0, -diff, 0.0), window)
+
+    total = up + down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * (up / total), 50.0)
+    if len(out):
+        out[0] = 50.0
+    return out
+
+
+def vwma(tp: np.ndarray, volume: np.ndarray, window: int = VWMA_WINDOW) -> np.ndarray:
+    rolling_tpv = rolling_sum(tp * volume, window)
+    rolling_vol = rolling_sum(volume, window)
+    return np.divide(
+        rolling_tpv, rolling_vol, out=np.zeros_like(rolling_tpv), where=rolling_vol != 0
+    )
+
+
+def mfi(tp: np.ndarray, volume: np.ndarray, window: int = MFI_WINDOW) -> np.ndarray:
+    raw_money_flow = tp * volume
+    tp_diff = np.zeros_like(tp)
+    tp_diff[1:] = np.diff(tp)
+
+    pos_sum = rolling_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), window)
+    neg_sum = rolling_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), window)
+
+    total = pos_sum + neg_sum
+    out = np.divide(pos_sum, total, out=np.full_like(pos_sum, 0.5), where=total > 0)
+    out[:window] = 0.5
+    return out
+
+
+def _price_columns(data: pd.DataFrame) -> Dict[str, np.ndarray]:
+    lowered = {str(col).lower(): col for col in data.columns}
+    return {
+        name: data[lowered[name]].to_numpy(dtype=np.float64)
+        for name in ("high", "low", "close", "volume")
+    }
+
+
+def has_missing_prices(data: pd.DataFrame) -> bool:
+    """Whether any high, low, close or volume value is missing."""
+    return any(np.isnan(values).any() for values in _price_columns(data).values())
+
+
+def compute_indicators(
+    data: pd.DataFrame, indicators: Iterable[str] = SUPPORTED_INDICATORS
+) -> Dict[str, np.ndarray]:
+    """Compute the requested indicators for an OHLCV frame sorted by date.
+
+    Intermediate series shared by several indicators (the MACD EMAs, the Bollinger
+    mean and deviation, the typical price) are computed only once. Frames with
+    missing prices are delegated to stockstats, which skips them the way pandas does.
+    """
+    indicators = tuple(indicators)
+    unknown = set(indicators) - set(SUPPORTED_INDICATORS)
+    if unknown:
+        raise ValueError(f"Unsupported indicators for the numpy backend: {sorted(unknown)}")
+
+    prices = _price_columns(data)
+    if any(np.isnan(values).any() for values in prices.values()):
+        print("DEBUG: Price history has missing values, computing indicators with stockstats")
+        return compute_with_stockstats(data, indicators)
+    close = prices["close"]
+    out = {}
+
+    if "close_50_sma" in indicators:
+        out["close_50_sma"] = sma(close, 50)
+    if "close_200_sma" in indicators:
+        out["close_200_sma"] = sma(close, 200)
+    if "close_10_ema" in indicators:
+        out["close_10_ema"] = ema(close, 10)
+
+    if {"macd", "macds", "macdh"} & set(indicators):
+        short_w, long_w, signal_w = MACD_WINDOWS
+        macd_line = ema(close, short_w) - ema(close, long_w)
+        signal = ema(macd_line, signal_w)
+        out["macd"] = macd_line
+        out["macds"] = signal
+        out["macdh"] = macd_line - signal
+
+    if "rsi" in indicators:
+        out["rsi"] = rsi(close)
+
+    if {"boll", "boll_ub", "boll_lb"} & set(indicators):
+        middle = sma(close, BOLL_WINDOW)
+        width = BOLL_STD_TIMES * rolling_std(close, BOLL_WINDOW)
+        out["boll"] = middle
+        out["boll_ub"] = middle + width
+        out["boll_lb"] = middle - width
+
+    if "atr" in indicators:
+        out["atr"] = smma(true_range(prices["high"], prices["low"], close), ATR_WINDOW)
+
+    if {"vwma", "mfi"} & set(indicators):
+        tp = (close + prices["high"] + prices["low"]) / 3.0
+        volume = prices["volume"]
+        if "vwma" in indicators:
+            out["vwma"] = vwma(tp, volume)
+        if "mfi" in indicators:
+            out["mfi"] = mfi(tp, volume)
+
+    return {name: out[name] for name in indicators}
+
+
+class IndicatorState:
+    """Recursive state after the last bar of a history.
+
+    The EMA, MACD, RSI and ATR recursions are kept as the numerator and weight sum
+    of the adjusted EWM, so each new bar costs O(1). The windowed indicators (SMAs,
+    Bollinger bands, VWMA and MFI) are recomputed from short tails of the inputs.
+    The state is a plain dict so it can be stored next to the price cache as JSON.
+    """
+
+    EWM_ALPHAS = {
+        "ema10": 2.0 / 11.0,
+        "ema12": 2.0 / (MACD_WINDOWS[0] + 1.0),
+        "ema26": 2.0 / (MACD_WINDOWS[1] + 1.0),
+        "macds": 2.0 / (MACD_WINDOWS[2] + 1.0),
+        "rsi_up": 1.0 / RSI_WINDOW,
+        "rsi_down": 1.0 / RSI_WINDOW,
+        "atr": 1.0 / ATR_WINDOW,
+    }
+    TAILS = {
+        "close": 200,
+        "tp": 2,
+        "tpv": VWMA_WINDOW,
+        "volume": VWMA_WINDOW,
+        "pos_flow": MFI_WINDOW,
+        "neg_flow": MFI_WINDOW,
+    }
+
+    def __init__(self, values: dict):
+        self.values = values
+
+    @classmethod
+    def from_history(cls, data: pd.DataFrame) -> "IndicatorState":
+        prices = _price_columns(data)
+        close, high, low, volume = prices["close"], prices["high"], prices["low"], prices["volume"]
+        n = len(close)
+
+        diff = np.zeros_like(close)
+        diff[1:] = np.diff(close)
+        macd_line = ema(close, MACD_WINDOWS[0]) - ema(close, MACD_WINDOWS[1])
+        inputs = {
+            "ema10": close,
+            "ema12": close,
+            "ema26": close,
+            "macds": macd_line,
+            "rsi_up": np.where(diff > 0, diff, 0.0),
+            "rsi_down": np.where(diff < 0, -diff, 0.0),
+            "atr": true_range(high, low, close),
+        }
+        ewm = {}
+        for name, x in inputs.items():
+            decay = 1.0 - cls.EWM_ALPHAS[name]
+            ewm[name] = {
+                "num": float(_decay_filter(x, decay)[-1]) if n else 0.0,
+                "den": float((1.0 - decay ** n) / (1.0 - decay)),
+            }
+
+        tp = (close + high + low) / 3.0
+        tp_diff = np.zeros_like(tp)
+        tp_diff[1:] = np.diff(tp)
+        flow = tp * volume
+        tails = {
+            "close": close,
+            "tp": tp,
+            "tpv": flow,
+            "volume": volume,
+            "pos_flow": np.where(tp_diff > 0, flow, 0.0),
+            "neg_flow": np.where(tp_diff < 0, flow, 0.0),
+        }
+
+        return cls(
+            {
+                "n": n,
+                "ewm": ewm,
+                "tails": {
+                    name: values[-cls.TAILS[name]:].tolist() for name, values in tails.items()
+                },
+            }
+        )
+
+    def _step_ewm(self, name: str, x: float) -> float:
+        state = self.values["ewm"][name]
+        decay = 1.0 - self.EWM_ALPHAS[name]
+        state["num"] = x + decay * state["num"]
+        state["den"] = 1.0 + decay * state["den"]
+        return state["num"] / state["den"]
+
+    def _push(self, name: str, x: float) -> list:
+        tail = self.values["tails"][name]
+        tail.append(x)
+        del tail[: max(0, len(tail) - self.TAILS[name])]
+        return tail
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """Advance the state by one bar and return every indicator for that bar."""
+        index = self.values["n"]
+        tails = self.values["tails"]
+        prev_close = tails["close"][-1] if tails["close"] else close
+        prev_tp = tails["tp"][-1] if tails["tp"] else None
+
+        out = {}
+        closes = self._push("close", close)
+        out["close_50_sma"] = float(np.mean(closes[-50:]))
+        out["close_200_sma"] = float(np.mean(closes[-200:]))
+        out["close_10_ema"] = self._step_ewm("ema10", close)
+
+        macd_line = self._step_ewm("ema12", close) - self._step_ewm("ema26", close)
+        signal = self._step_ewm("macds", macd_line)
+        out["macd"] = macd_line
+        out["macds"] = signal
+        out["macdh"] = macd_line - signal
+
+        diff = close - prev_close
+        up = self._step_ewm("rsi_up", diff if diff > 0 else 0.0)
+        down = self._step_ewm("rsi_down", -diff if diff < 0 else 0.0)
+        total = up + down
+        out["rsi"] = 50.0 if index == 0 or total == 0 else 100 * (up / total)
+
+        boll_window = closes[-BOLL_WINDOW:]
+        middle = float(np.mean(boll_window))
+        std = float(np.std(boll_window, ddof=1)) if len(boll_window) > 1 else float("nan")
+        out["boll"] = middle
+        out["boll_ub"] = middle + BOLL_STD_TIMES * std
+        out["boll_lb"] = middle - BOLL_STD_TIMES * std
+
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        out["atr"] = self._step_ewm("atr", 0.0 if np.isnan(tr) else tr)
+
+        tp = (close + high + low) / 3.0
+        flow = tp * volume
+        self._push("tp", tp)
+        rolling_tpv = sum(self._push("tpv", flow))
+        rolling_vol = sum(self._push("volume", volume))
+        out["vwma"] = rolling_tpv / rolling_vol if rolling_vol != 0 else 0.0
+
+        tp_diff = 0.0 if prev_tp is None else tp - prev_tp
+        pos_sum = sum(self._push("pos_flow", flow if tp_diff > 0 else 0.0))
+        neg_sum = sum(self._push("neg_flow", flow if tp_diff < 0 else 0.0))
+        total_flow = pos_sum + neg_sum
+        if index < MFI_WINDOW or not total_flow > 0:
+            out["mfi"] = 0.5
+        else:
+            out["mfi"] = pos_sum / total_flow
+
+        self.values["n"] = index + 1
+        return out
+
+    def to_json(self) -> str:
+        return json.dumps(self.values)
+
+    @classmethod
+    def from_json(cls, payload: str) -> "IndicatorState":
+        return cls(json.loads(payload))
+
+
+def compute_with_stockstats(
+    data: pd.DataFrame, indicators: Iterable[str] = SUPPORTED_INDICATORS
+) -> Dict[str, np.ndarray]:
+    """Reference implementation through ``stockstats.wrap``."""
+    from stockstats import wrap
+
+    df = wrap(data.copy())
+    return {name: df[name].to_numpy(dtype=np.float64) for name in indicators}
+
+
+def parity_report(data: pd.DataFrame, rtol: float = 1e-6, atol: float = 1e-8) -> Dict[str, dict]:
+    """Compare both backends on one frame. Returns per-indicator max error and a pass flag."""
+    expected = compute_with_stockstats(data)
+    actual = compute_indicators(data)
+
+    report = {}
+    for name in SUPPORTED_INDICATORS:
+        a, b = actual[name], expected[name]
+        both_nan = np.isnan(a) & np.isnan(b)
+        diff = np.where(both_nan, 0.0, np.abs(a - b))
+        report[name] = {
+            "max_abs_error": float(np.nanmax(diff)) if len(diff) else 0.0,
+            "ok": bool(np.allclose(a, b, rtol=rtol, atol=atol, equal_nan=True)),
+        }
+    return report
+
+
+def benchmark(data: pd.DataFrame, repeat: int = 5) -> Dict[str, float]:
+    """Average seconds to compute all indicators with each backend."""
+    timings = {}
+    for name, func in (("stockstats", compute_with_stockstats), ("numpy", compute_indicators)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(data)
+        timings[name] = (time.perf_counter() - start) / repeat
+    return timings
+
@@ -0,0 +1,281 @@
+import os
+import json
+import time
+import threading
+from collections import defaultdict
+from typing import Annotated, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+
+HISTORY_YEARS = 15
+# Days re-downloaded before the cached end, so a tail fetch always overlaps cached bars
+OVERLAP_DAYS = 7
+
+_symbol_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _symbol_lock(symbol: str) -> threading.Lock:
+    """Return the lock serializing cache writes for a symbol."""
+    with _locks_guard:
+        return _symbol_locks.setdefault(symbol, threading.Lock())
+
+
+def get_price_cache_paths(symbol: Annotated[str, "ticker symbol of the company"]) -> Tuple[str, str]:
+    """Return ``(csv_path, meta_path)`` of the incremental cache for a symbol."""
+    symbol = symbol.upper()
+    cache_dir = get_config()["data_cache_dir"]
+    return (
+        os.path.join(cache_dir, f"{symbol}-YFin-data.csv"),
+        os.path.join(cache_dir, f"{symbol}-YFin-data.json"),
+    )
+
+
+def _download(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    data = yf.download(
+        symbol,
+        start=start_date,
+        end=end_date,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    data = data.reset_index()
+    if not data.empty:
+        data["Date"] = pd.to_datetime(data["Date"]).dt.strftime("%Y-%m-%d")
+    return data
+
+
+def _read_meta(meta_path: str):
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, "r") as f:
+        return json.load(f)
+
+
+def _write_meta(meta_path: str, meta: dict):
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def load_price_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+) -> Tuple[pd.DataFrame, str]:
+    """Return the cached daily history for a symbol, fetching only what is missing.
+
+    The cache is one CSV per symbol (``{symbol}-YFin-data.csv``) plus a JSON sidecar
+    recording the date range already requested from Yahoo Finance. The first call
+    downloads ``HISTORY_YEARS`` of history. Later calls download from a few days
+    before the recorded end and append the new bars to the CSV. Prices are
+    split/dividend adjusted, so when the re-downloaded overlapping bars no longer
+    match the cache, Yahoo has re-adjusted the past and the full history is
+    fetched again and rewritten. Returns the full history frame and the CSV path.
+    """
+    symbol = symbol.upper()
+    csv_path, meta_path = get_price_cache_paths(symbol)
+    today = pd.Timestamp.today().strftime("%Y-%m-%d")
+
+    with _symbol_lock(symbol):
+        meta = _read_meta(meta_path)
+
+        if meta is None or not os.path.exists(csv_path):
+            start_date = (
+                pd.Timestamp.today() - pd.DateOffset(years=HISTORY_YEARS)
+            ).strftime("%Y-%m-%d")
+            data = _download(symbol, start_date, today)
+            return _store(symbol, None, data, start_date, today), csv_path
+
+        data = pd.read_csv(csv_path)
+
+        if meta["end"] < today:
+            tail = _download(symbol, _overlap_start(meta["end"]), today)
+            data = _store_tail(symbol, data, tail, meta["start"], today)
+
+        return data, csv_path
+
+
+def _overlap_start(end_date: str) -> str:
+    return (pd.Timestamp(end_date) - pd.Timedelta(days=OVERLAP_DAYS)).strftime("%Y-%m-%d")
+
+
+def _history_rewritten(data: pd.DataFrame, downloaded: pd.DataFrame) -> bool:
+    """Whether the re-downloaded bars disagree with the cached closes on the same dates."""
+    if data.empty or downloaded.empty:
+        return False
+    overlap = data[["Date", "Close"]].merge(
+        downloaded[["Date", "Close"]], on="Date", suffixes=("_cached", "_new")
+    )
+    if overlap.empty:
+        return False
+    return not np.allclose(
+        overlap["Close_cached"].astype(float),
+        overlap["Close_new"].astype(float),
+        rtol=1e-4,
+        equal_nan=True,
+    )
+
+
+def _store_tail(symbol: str, data: pd.DataFrame, downloaded: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
+    """Append an overlapping tail download, or refetch everything if the past was re-adjusted."""
+    if _history_rewritten(data, downloaded):
+        print(f"DEBUG: Cached prices for {symbol} were re-adjusted (split or dividend), refetching full history")
+        return _store(symbol, None, _download(symbol, start_date, end_date), start_date, end_date)
+    return _store(symbol, data, downloaded, start_date, end_date)
+
+
+def _store(symbol: str, data, downloaded: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
+    """Write ``downloaded`` bars into a symbol's cache and return the full history.
+
+    With no cached ``data`` the CSV is written from scratch. Otherwise only the bars
+    after the last cached date are appended. The sidecar is updated last. Callers
+    hold the symbol lock.
+    """
+    csv_path, meta_path = get_price_cache_paths(symbol)
+
+    if data is None:
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        downloaded.to_csv(csv_path, index=False)
+        data = downloaded
+    else:
+        tail = downloaded
+        if not data.empty and not tail.empty:
+            tail = tail[tail["Date"] > data["Date"].iloc[-1]]
+        if not tail.empty and data.empty:
+            tail.to_csv(csv_path, index=False)
+            data = tail
+        elif not tail.empty:
+            tail = tail.reindex(columns=data.columns)
+            tail.to_csv(csv_path, mode="a", header=False, index=False)
+            data = pd.concat([data, tail], ignore_index=True)
+
+    _write_meta(meta_path, {"start": start_date, "end": end_date})
+    return data
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    frame = frame.dropna(how="all").reset_index()
+    if not frame.empty:
+        frame["Date"] = pd.to_datetime(frame["Date"]).dt.strftime("%Y-%m-%d")
+    return frame
+
+
+def _download_many(symbols: List[str], start_date: str, end_date: str, threads: bool) -> Dict[str, pd.DataFrame]:
+    """Download several symbols in one request and split them per symbol."""
+    data = yf.download(
+        symbols,
+        start=start_date,
+        end=end_date,
+        group_by="ticker",
+        progress=False,
+        auto_adjust=True,
+        threads=threads,
+    )
+    if data.empty:
+        return {}
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {symbols[0]: _normalize(data)}
+
+    available = set(data.columns.get_level_values(0))
+    result = {}
+    for symbol in symbols:
+        if symbol in available:
+            frame = _normalize(data[symbol])
+            if not frame.empty:
+                frame.columns.name = None
+                result[symbol] = frame
+    return result
+
+
+def prefetch_universe(
+    symbols: Iterable[str],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    chunk_size: int = 100,
+    threads: bool = True,
+) -> dict:
+    """Warm the per-symbol price caches for a whole universe with bulk downloads.
+
+    Symbols without a cache are downloaded from ``start_date`` (default:
+    ``HISTORY_YEARS`` ago) and stale caches from a few days before their recorded
+    end (refetching in full when the past was re-adjusted), in chunks of
+    ``chunk_size`` symbols per multi-ticker ``yf.download``. Each result is split
+    into the same ``{symbol}-YFin-data.csv`` plus sidecar layout that
+    ``load_price_history`` reads, so later indicator and price calls hit the
+    cache. Returns counts and the throughput in symbols per second.
+    """
+    today = pd.Timestamp.today().strftime("%Y-%m-%d")
+    end_date = end_date or today
+    start_date = start_date or (
+        pd.Timestamp.today() - pd.DateOffset(years=HISTORY_YEARS)
+    ).strftime("%Y-%m-%d")
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+
+    # Group the work by download start: a fresh fetch, or the tail after each cache's end
+    pending: Dict[str, List[str]] = defaultdict(list)
+    skipped = 0
+    for symbol in symbols:
+        csv_path, meta_path = get_price_cache_paths(symbol)
+        meta = _read_meta(meta_path)
+        if meta is None or not os.path.exists(csv_path):
+            pending[start_date].append(symbol)
+        elif meta["end"] < end_date:
+            pending[_overlap_start(meta["end"])].append(symbol)
+        else:
+            skipped += 1
+
+    started = time.perf_counter()
+    fetched, failed = 0, []
+    for chunk_start, group in pending.items():
+        for i in range(0, len(group), chunk_size):
+            chunk = group[i : i + chunk_size]
+            try:
+                frames = _download_many(chunk, chunk_start, end_date, threads)
+            except Exception as e:
+                print(f"FAILED: Bulk download of {len(chunk)} symbols: {e}")
+                failed.extend(chunk)
+                continue
+
+            for symbol in chunk:
+                if symbol not in frames:
+                    failed.append(symbol)
+                    continue
+                csv_path, meta_path = get_price_cache_paths(symbol)
+                with _symbol_lock(symbol):
+                    meta = _read_meta(meta_path)
+                    if meta is None or not os.path.exists(csv_path):
+                        _store(symbol, None, frames[symbol], chunk_start, end_date)
+                    else:
+                        _store_tail(symbol, pd.read_csv(csv_path), frames[symbol], meta["start"], end_date)
+                fetched += 1
+
+    seconds = time.perf_counter() - started
+    stats = {
+        "symbols": len(symbols),
+        "fetched": fetched,
+        "skipped": skipped,
+        "failed": failed,
+        "seconds": round(seconds, 2),
+        "symbols_per_second": round(fetched / seconds, 2) if seconds > 0 else 0.0,
+    }
+    print(
+        f"SUCCESS: Prefetched {fetched}/{len(symbols)} symbols "
+        f"({skipped} already cached, {len(failed)} failed) "
+        f"in {stats['seconds']}s, {stats['symbols_per_second']} symbols/s"
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    import sys
+
+    universe = sys.argv[1:] or [
+        "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "JPM", "V", "WMT",
+        "JNJ", "PG", "XOM", "UNH", "HD", "MA", "AVGO", "COST", "PEP", "KO",
+    ]
+    prefetch_universe(universe)
@@ -0,0 +1,142 @@
+import os
+import json
+import threading
+from typing import Annotated, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class LocalPriceStore:
+    """Columnar, memory-mapped store for the local OHLCV CSV files.
+
+    Each ``{symbol}-*.csv`` file under ``price_data_dir`` is converted once into a
+    directory of ``.npy`` files (one per column) plus a ``meta.json`` describing
+    the source file. The ``Date`` column is stored as ``datetime64[D]`` and acts
+    as a sorted index, so a range query is two binary searches and a slice of the
+    memory-mapped columns instead of a full CSV parse. The store is rebuilt
+    automatically whenever the source CSV changes on disk.
+    """
+
+    DATE_COLUMN = "Date"
+
+    def __init__(self, price_data_dir: str, store_dir: str):
+        self.price_data_dir = price_data_dir
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+        self._symbol_files: Dict[str, str] = {}
+        self._tables: Dict[str, Tuple[dict, Dict[str, np.ndarray]]] = {}
+
+    def find_source_file(self, symbol: str) -> str:
+        """Return the CSV file name backing ``symbol``."""
+        if symbol not in self._symbol_files:
+            if not os.path.exists(self.price_data_dir):
+                raise FileNotFoundError(
+                    f"Price data directory not found: {self.price_data_dir}"
+                )
+
+            matching_files = sorted(
+                filename
+                for filename in os.listdir(self.price_data_dir)
+                if filename.startswith(f"{symbol}-") and filename.endswith(".csv")
+            )
+
+            if not matching_files:
+                raise FileNotFoundError(
+                    f"No local data file found for symbol '{symbol}' in {self.price_data_dir}. "
+                    f"Expected format: {symbol}-YFin-data-YYYY-MM-DD-YYYY-MM-DD.csv"
+                )
+
+            self._symbol_files[symbol] = matching_files[0]
+
+        return self._symbol_files[symbol]
+
+    def load(self, symbol: str) -> Tuple[dict, Dict[str, np.ndarray]]:
+        """Return ``(meta, columns)`` for a symbol, building the store if needed."""
+        csv_file = self.find_source_file(symbol)
+        csv_path = os.path.join(self.price_data_dir, csv_file)
+        stat = os.stat(csv_path)
+        source = {"file": csv_file, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        with self._lock:
+            cached = self._tables.get(symbol)
+            if cached is not None and cached[0]["source"] == source:
+                return cached
+
+            symbol_dir = os.path.join(self.store_dir, symbol)
+            meta = self._read_meta(symbol_dir)
+            if meta is None or meta["source"] != source:
+                print(f"DEBUG: Building columnar price store for {symbol} from: {csv_file}")
+                meta = self._build(csv_path, symbol_dir, source)
+
+            columns = {
+                name: np.load(os.path.join(symbol_dir, f"{index}.npy"), mmap_mode="r")
+                for index, name in enumerate(meta["columns"])
+            }
+            self._tables[symbol] = (meta, columns)
+            return self._tables[symbol]
+
+    def get_range(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    ) -> pd.DataFrame:
+        """Return the rows between ``start_date`` and ``end_date`` (inclusive)."""
+        meta, columns = self.load(symbol)
+        dates = columns[self.DATE_COLUMN]
+
+        lo = np.searchsorted(dates, np.datetime64(start_date, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end_date, "D"), side="right")
+
+        frame = {}
+        for name in meta["columns"]:
+            values = columns[name][lo:hi]
+            if name == self.DATE_COLUMN:
+                values = np.datetime_as_string(values, unit="D")
+            frame[name] = values
+
+        return pd.DataFrame(frame, columns=meta["columns"])
+
+    def _read_meta(self, symbol_dir: str) -> Optional[dict]:
+        meta_path = os.path.join(symbol_dir, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "r") as f:
+            return json.load(f)
+
+    def _build(self, csv_path: str, symbol_dir: str, source: dict) -> dict:
+        # Skip comment lines starting with #, same as the plain CSV reader
+        data = pd.read_csv(csv_path, comment="#")
+        data[self.DATE_COLUMN] = (
+            pd.to_datetime(data[self.DATE_COLUMN].astype(str).str[:10])
+            .values.astype("datetime64[D]")
+        )
+        data = data.sort_values(self.DATE_COLUMN, kind="mergesort").reset_index(drop=True)
+
+        os.makedirs(symbol_dir, exist_ok=True)
+        columns = list(data.columns)
+        for index, name in enumerate(columns):
+            values = data[name].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            np.save(os.path.join(symbol_dir, f"{index}.npy"), np.ascontiguousarray(values))
+
+        meta = {"source": source, "columns": columns, "rows": len(data)}
+        # Write meta last so a half-built store is never picked up
+        with open(os.path.join(symbol_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        return meta
+
+
+_stores: Dict[Tuple[str, str], LocalPriceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_price_store(price_data_dir: str, store_dir: str) -> LocalPriceStore:
+    """Return the process-wide store for a price data directory."""
+    key = (os.path.abspath(price_data_dir), os.path.abspath(store_dir))
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = LocalPriceStore(price_data_dir, store_dir)
+        return _stores[key]
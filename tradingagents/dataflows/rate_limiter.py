@@ -0,0 +1,140 @@
+import time
+import asyncio
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class TokenBucket:
+    """Token bucket holding up to ``capacity`` tokens, refilled at ``capacity / period`` per second."""
+
+    def __init__(self, capacity: float, period: float):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self, now: float) -> float:
+        self._refill(now)
+        return self.tokens
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+    def drain(self, now: float):
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class KeyRotatingRateLimiter:
+    """Client-side rate limiter for an API quota, rotating over several keys.
+
+    Each key has a per-minute and a per-day token bucket. ``reserve`` hands out the
+    key with the most minute headroom that has a token in both buckets, waiting for
+    the next token when every key is exhausted. Waits longer than ``max_wait``
+    raise ``exhausted_error`` instead, so callers can fall back to another vendor
+    rather than blocking for hours on a daily quota.
+    """
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        per_minute: float,
+        per_day: float,
+        max_wait: float = 60,
+        exhausted_error: type = RuntimeError,
+    ):
+        if not api_keys:
+            raise ValueError("At least one API key is required")
+        self.max_wait = max_wait
+        self.exhausted_error = exhausted_error
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[TokenBucket, TokenBucket]] = {
+            key: (TokenBucket(per_minute, 60), TokenBucket(per_day, 86400))
+            for key in api_keys
+        }
+        self._metrics = {
+            key: {"requests": 0, "throttled": 0, "wait_seconds": 0.0, "server_rejections": 0}
+            for key in api_keys
+        }
+
+    def _try_acquire(self) -> Tuple[Optional[str], float]:
+        """Take a token and return ``(key, 0)``, or ``(None, seconds to wait)``."""
+        now = time.monotonic()
+        with self._lock:
+            best_key, best_headroom, shortest_wait = None, -1.0, float("inf")
+            for key, (minute, day) in self._buckets.items():
+                wait = max(minute.wait_time(now), day.wait_time(now))
+                if wait == 0 and minute.available(now) > best_headroom:
+                    best_key, best_headroom = key, minute.available(now)
+                shortest_wait = min(shortest_wait, wait)
+
+            if best_key is None:
+                return None, shortest_wait
+            for bucket in self._buckets[best_key]:
+                bucket.take()
+            self._metrics[best_key]["requests"] += 1
+            return best_key, 0.0
+
+    def _check_wait(self, wait: float, waited: float):
+        if waited + wait > self.max_wait:
+            raise self.exhausted_error(
+                f"Client-side rate limit: next request slot in {wait:.0f}s exceeds max wait of {self.max_wait}s"
+            )
+
+    def _record_wait(self, key: str, waited: float):
+        if waited:
+            with self._lock:
+                self._metrics[key]["throttled"] += 1
+                self._metrics[key]["wait_seconds"] += waited
+
+    def reserve(self) -> str:
+        """Block until a request slot is free and return the API key to use."""
+        waited = 0.0
+        while True:
+            key, wait = self._try_acquire()
+            if key is not None:
+                self._record_wait(key, waited)
+                return key
+            self._check_wait(wait, waited)
+            time.sleep(wait)
+            waited += wait
+
+    async def areserve(self) -> str:
+        """Async variant of ``reserve`` that waits without blocking the event loop."""
+        waited = 0.0
+        while True:
+            key, wait = self._try_acquire()
+            if key is not None:
+                self._record_wait(key, waited)
+                return key
+            self._check_wait(wait, waited)
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def penalize(self, key: str):
+        """Mark a key as out of minute quota after the server rejected a request."""
+        with self._lock:
+            self._buckets[key][0].drain(time.monotonic())
+            self._metrics[key]["server_rejections"] += 1
+
+    def stats(self) -> Dict[str, dict]:
+        """Remaining headroom and request counters per (masked) key."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                f"...{key[-4:]}": {
+                    "minute_headroom": round(minute.available(now), 2),
+                    "day_headroom": round(day.available(now), 2),
+                    **self._metrics[key],
+                }
+                for key, (minute, day) in self._buckets.items()
+            }
@@ -0,0 +1,153 @@
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .config import get_config
+
+
+class RedditIndex:
+    """SQLite index over the Reddit ``.jsonl`` dumps, partitioned by post date.
+
+    Every subreddit file is parsed once and its posts are stored with their UTC
+    post date, indexed on ``(category, post_date)`` where the category is the
+    absolute path of its directory. A file is re-ingested when its size or mtime
+    changes, and dropped from the index when it disappears, so a date-range query
+    only reads the matching rows.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " category TEXT NOT NULL,"
+                " file TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " PRIMARY KEY (category, file))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS posts ("
+                " category TEXT NOT NULL,"
+                " file TEXT NOT NULL,"
+                " line_no INTEGER NOT NULL,"
+                " post_date TEXT NOT NULL,"
+                " title TEXT,"
+                " selftext TEXT,"
+                " url TEXT,"
+                " ups INTEGER)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS posts_by_date ON posts (category, post_date)"
+            )
+
+    def _ingest_file(self, category: str, file: str, file_path: str):
+        rows = []
+        with open(file_path, "rb") as f:
+            for line_no, line in enumerate(f):
+                # skip empty lines
+                if not line.strip():
+                    continue
+                parsed_line = json.loads(line)
+                post_date = datetime.utcfromtimestamp(
+                    parsed_line["created_utc"]
+                ).strftime("%Y-%m-%d")
+                rows.append(
+                    (
+                        category,
+                        file,
+                        line_no,
+                        post_date,
+                        parsed_line["title"],
+                        parsed_line["selftext"],
+                        parsed_line["url"],
+                        parsed_line["ups"],
+                    )
+                )
+
+        self._conn.execute(
+            "DELETE FROM posts WHERE category = ? AND file = ?", (category, file)
+        )
+        self._conn.executemany("INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def sync(self, category_path: str):
+        """Bring the index for a category directory up to date with its files."""
+        category = os.path.abspath(category_path)
+        on_disk = {}
+        for data_file in os.listdir(category_path):
+            if data_file.endswith(".jsonl"):
+                stat = os.stat(os.path.join(category_path, data_file))
+                on_disk[data_file] = (stat.st_size, stat.st_mtime_ns)
+
+        with self._lock, self._conn:
+            indexed = {
+                file: (size, mtime_ns)
+                for file, size, mtime_ns in self._conn.execute(
+                    "SELECT file, size, mtime_ns FROM files WHERE category = ?", (category,)
+                )
+            }
+
+            for file in indexed.keys() - on_disk.keys():
+                self._conn.execute(
+                    "DELETE FROM posts WHERE category = ? AND file = ?", (category, file)
+                )
+                self._conn.execute(
+                    "DELETE FROM files WHERE category = ? AND file = ?", (category, file)
+                )
+
+            for file, signature in on_disk.items():
+                if indexed.get(file) == signature:
+                    continue
+                print(f"DEBUG: Indexing reddit file {os.path.join(category, file)}")
+                self._ingest_file(category, file, os.path.join(category_path, file))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                    (category, file, *signature),
+                )
+
+    def query(self, category_path: str, start_date: str, end_date: str) -> List[dict]:
+        """Return the posts of a category directory dated in ``[start_date, end_date]``.
+
+        Posts are ordered by date, then file, then upvotes (descending) with ties
+        kept in file order.
+        """
+        category = os.path.abspath(category_path)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT file, post_date, title, selftext, url, ups FROM posts"
+                " WHERE category = ? AND post_date BETWEEN ? AND ?"
+                " ORDER BY post_date, file, ups DESC, line_no",
+                (category, start_date, end_date),
+            ).fetchall()
+
+        return [
+            {
+                "file": file,
+                "posted_date": post_date,
+                "title": title,
+                "selftext": selftext,
+                "url": url,
+                "ups": ups,
+            }
+            for file, post_date, title, selftext, url, ups in rows
+        ]
+
+
+_indexes: Dict[str, RedditIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_reddit_index(path: Optional[str] = None) -> RedditIndex:
+    """Return the shared index, stored under ``data_cache_dir`` by default."""
+    path = path or os.path.join(get_config()["data_cache_dir"], "reddit_index.sqlite")
+    with _indexes_lock:
+        if path not in _indexes:
+            _indexes[path] = RedditIndex(path)
+        return _indexes[path]
@@ -3,9 +3,13 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Dict, Iterable, List, Set, Tuple
 import os
 import re
+from collections import defaultdict
+
+from .reddit_index import get_reddit_index
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,21 +53,90 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
+@lru_cache(maxsize=None)
+def _compile_company_pattern(ticker: str, company: str) -> re.Pattern:
+    # Cached on the table entry itself, so editing ticker_to_company recompiles
+    search_terms = company.split(" OR ") if "OR" in company else [company]
+    search_terms.append(ticker)
+    return re.compile(
+        "|".join(f"(?:{term})" for term in search_terms), re.IGNORECASE
+    )
+
+
+def company_matcher(ticker: str) -> re.Pattern:
+    """Single compiled alternation of a ticker's company names and the ticker itself."""
+    return _compile_company_pattern(ticker, ticker_to_company[ticker])
+
+
+def mentions_company(ticker: str, title: str, selftext: str) -> bool:
+    """Check that the title or the content mentions the company's name (ticker)."""
+    matcher = company_matcher(ticker)
+    return bool(matcher.search(title) or matcher.search(selftext))
+
+
+@lru_cache(maxsize=64)
+def _compile_company_tagger(entries: Tuple[Tuple[str, str], ...]) -> Tuple[re.Pattern, List[str]]:
+    terms = []
+    for ticker, company in entries:
+        search_terms = company.split(" OR ") if "OR" in company else [company]
+        terms.extend((ticker, term) for term in search_terms + [ticker])
+
+    # Every term is a zero-width lookahead, so all terms starting at a position are
+    # captured, even when one company name is a prefix of another (Square/Squarespace).
+    # The leading alternation makes the scan stop only where some term starts.
+    pattern = "(?=" + "|".join(f"(?:{term})" for _, term in terms) + ")" + "".join(
+        f"(?:(?=(?P<t{i}>{term})))?" for i, (_, term) in enumerate(terms)
+    )
+    return re.compile(pattern, re.IGNORECASE), [ticker for ticker, _ in terms]
+
+
+def company_tagger(tickers: Iterable[str]) -> Tuple[re.Pattern, List[str]]:
+    """One compiled pattern for several tickers, with the ticker of each ``t{i}`` group."""
+    return _compile_company_tagger(
+        tuple((ticker, ticker_to_company[ticker]) for ticker in dict.fromkeys(tickers))
+    )
+
+
+def post_tickers(title: str, selftext: str, tickers: Iterable[str] = None) -> Set[str]:
+    """Tag a post with every ticker in ``tickers`` (default: all known) it mentions.
+
+    Same result as ``mentions_company`` per ticker, in a single regex pass.
+    """
+    pattern, group_tickers = company_tagger(ticker_to_company if tickers is None else tickers)
+    found = set()
+    for text in (title, selftext):
+        for match in pattern.finditer(text):
+            found.update(
+                group_tickers[int(name[1:])]
+                for name, value in match.groupdict().items()
+                if value is not None
+            )
+    return found
+
+
+def fetch_top_from_category_multi(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
     ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
-    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    start_date: Annotated[str, "First date to fetch top posts from."],
+    end_date: Annotated[str, "Last date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    queries: Annotated[List[str], "Queries to search for in the subreddit."],
     data_path: Annotated[
         str,
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
-):
+) -> Dict[str, List[dict]]:
+    """``fetch_top_from_category_range`` for several queries in one pass.
+
+    The window is read from the index once and each post is tagged with all the
+    queries it mentions by ``post_tickers``, so a batch over many tickers scans the
+    corpus once. Each query keeps its own per-day, per-subreddit limit, and gets
+    the same posts the range function returns for it.
+    """
     base_path = data_path
 
-    all_content = []
+    all_content = {query: [] for query in queries}
 
     # Check if the data path exists
     category_path = os.path.join(base_path, category)
@@ -84,62 +157,126 @@ def fetch_top_from_category(
 
     limit_per_subreddit = max_limit // len(files_in_category)
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
-        # check if data_file is a .jsonl file
-        if not data_file.endswith(".jsonl"):
-            continue
+    # if is company_news, only keep posts that mention the company's name (query)
+    filter_company = "company" in category
+    tickers = [query for query in all_content if query]
+    unfiltered = [query for query in all_content if not (filter_company and query)]
+
+    index = get_reddit_index()
+    index.sync(category_path)
+
+    # Rows arrive ordered by date, subreddit file and upvotes, so the first
+    # limit_per_subreddit matches of each (query, date, file) group are the top posts
+    kept = defaultdict(int)
+    for row in index.query(category_path, start_date, end_date):
+        matched = unfiltered
+        if filter_company and tickers:
+            mentioned = post_tickers(row["title"], row["selftext"], tickers)
+            matched = [query for query in all_content if query in mentioned] + unfiltered
+
+        post = None
+        for query in matched:
+            group = (query, row["posted_date"], row["file"])
+            if kept[group] >= limit_per_subreddit:
+                continue
+            kept[group] += 1
+            if post is None:
+                post = {
+                    "title": row["title"],
+                    "content": row["selftext"],
+                    "url": row["url"],
+                    "upvotes": row["ups"],
+                    "posted_date": row["posted_date"],
+                }
+            all_content[query].append(post)
+
+    return all_content
 
-        all_content_curr_subreddit = []
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
+def fetch_top_from_category_range(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from."],
+    end_date: Annotated[str, "Last date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    """Top posts of every day in ``[start_date, end_date]``, in date order.
 
-                parsed_line = json.loads(line)
+    Each day keeps at most ``max_limit // number of files`` posts per subreddit,
+    ranked by upvotes, exactly as ``fetch_top_from_category`` does for one day.
+    Posts are read from the date index rather than by scanning the dumps.
+    """
+    base_path = data_path
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
+    all_content = []
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
+    # Check if the data path exists
+    category_path = os.path.join(base_path, category)
+    if not os.path.exists(category_path):
+        print(f"WARNING: Reddit data path does not exist: {category_path}")
+        return all_content
 
-                    search_terms.append(query)
+    # Check if category directory has any files
+    files_in_category = os.listdir(category_path)
+    if len(files_in_category) == 0:
+        print(f"WARNING: No data files found in {category_path}")
+        return all_content
 
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
+    if max_limit < len(files_in_category):
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
 
-                    if not found:
-                        continue
+    limit_per_subreddit = max_limit // len(files_in_category)
 
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
+    index = get_reddit_index()
+    index.sync(category_path)
 
-                all_content_curr_subreddit.append(post)
+    # Rows arrive ordered by date, subreddit file and upvotes, so the first
+    # limit_per_subreddit matches of each (date, file) group are the top posts
+    kept = defaultdict(int)
+    for row in index.query(category_path, start_date, end_date):
+        group = (row["posted_date"], row["file"])
+        if kept[group] >= limit_per_subreddit:
+            continue
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+        # if is company_news, check that the title or the content has the company's name (query) mentioned
+        if "company" in category and query:
+            if not mentions_company(query, row["title"], row["selftext"]):
+                continue
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+        kept[group] += 1
+        all_content.append(
+            {
+                "title": row["title"],
+                "content": row["selftext"],
+                "url": row["url"],
+                "upvotes": row["ups"],
+                "posted_date": row["posted_date"],
+            }
+        )
 
     return all_content
+
+
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query=query, data_path=data_path
+    )
@@ -0,0 +1,174 @@
+import os
+import re
+import json
+import time
+import pickle
+import hashlib
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from .config import get_config
+
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+class ResponseCache:
+    """Content-addressed cache for vendor responses, persisted in SQLite.
+
+    Entries are keyed by a hash of ``(method, vendor config, normalized args)``.
+    Every entry gets the TTL of its tool category. A request whose date arguments
+    all lie more than ``historical_after_days`` in the past can no longer change,
+    so it is cached without expiry. The database uses WAL mode, so several
+    processes can share one cache file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 3600,
+        historical_after_days: int = 7,
+    ):
+        self.path = path
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.historical_after_days = historical_after_days
+        self.hits = Counter()
+        self.misses = Counter()
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " method TEXT NOT NULL,"
+                " value BLOB NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " expires_at REAL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        if isinstance(value, str):
+            return value.strip()
+        if isinstance(value, (list, tuple)):
+            return [ResponseCache._normalize(v) for v in value]
+        if isinstance(value, dict):
+            return {str(k): ResponseCache._normalize(v) for k, v in sorted(value.items())}
+        return value
+
+    def make_key(self, method: str, vendor_config: str, args: tuple, kwargs: dict) -> str:
+        payload = json.dumps(
+            [
+                method,
+                ",".join(v.strip() for v in vendor_config.split(",")),
+                self._normalize(list(args)),
+                self._normalize(kwargs),
+            ],
+            default=str,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, category: str, args: tuple, kwargs: dict) -> Optional[float]:
+        """Return the TTL in seconds, or ``None`` for a permanent entry."""
+        dates = [
+            v.strip()
+            for v in list(args) + list(kwargs.values())
+            if isinstance(v, str) and DATE_PATTERN.match(v.strip())
+        ]
+        if dates:
+            cutoff = (
+                datetime.now() - timedelta(days=self.historical_after_days)
+            ).strftime("%Y-%m-%d")
+            if max(dates) < cutoff:
+                return None
+        return self.ttls.get(category, self.default_ttl)
+
+    def get(self, method: str, key: str) -> Tuple[bool, Any]:
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        hit = row is not None and (row[1] is None or row[1] > time.time())
+        with self._stats_lock:
+            (self.hits if hit else self.misses)[method] += 1
+        if not hit:
+            return False, None
+        return True, pickle.loads(row[0])
+
+    def set(self, method: str, key: str, value: Any, ttl: Optional[float]):
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, method, value, created_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    method,
+                    pickle.dumps(value),
+                    now,
+                    None if ttl is None else now + ttl,
+                ),
+            )
+
+    def purge_expired(self) -> int:
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process, overall and per method."""
+        with self._stats_lock:
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "by_method": {
+                    method: {"hits": self.hits[method], "misses": self.misses[method]}
+                    for method in sorted(set(self.hits) | set(self.misses))
+                },
+            }
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or ``None`` when it is disabled."""
+    global _cache
+    config = get_config()
+    cache_config = config.get("response_cache", {})
+    if not cache_config.get("enabled", False):
+        return None
+
+    path = cache_config.get("path") or os.path.join(
+        config["data_cache_dir"], "response_cache.sqlite"
+    )
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            _cache = ResponseCache(
+                path,
+                ttls=cache_config.get("ttl"),
+                default_ttl=cache_config.get("default_ttl", 3600),
+                historical_after_days=cache_config.get("historical_after_days", 7),
+            )
+        return _cache
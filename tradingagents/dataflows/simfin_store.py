@@ -0,0 +1,131 @@
+import os
+import json
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+import pandas as pd
+
+
+class SimFinStore:
+    """Per-ticker partitioned store for the US-market SimFin statement CSVs.
+
+    Each ``us-{statement}-{freq}.csv`` is parsed once, with its date columns
+    normalized, and split into one pickled frame per ticker sorted by
+    ``Publish Date``. The partitions are rebuilt whenever the source CSV changes,
+    and loaded partitions stay in memory, so a point-in-time lookup is a binary
+    search over a few dozen rows instead of a parse of the whole market.
+    """
+
+    DATE_COLUMNS = ("Report Date", "Publish Date")
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+        self._metas: Dict[str, dict] = {}
+        self._tickers: Dict[str, Set[str]] = {}
+        self._frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+
+    def _partition_dir(self, csv_path: str) -> str:
+        return os.path.join(
+            self.store_dir, os.path.splitext(os.path.basename(csv_path))[0]
+        )
+
+    @staticmethod
+    def _partition_file(ticker: str) -> str:
+        return ticker.replace(os.sep, "_") + ".pkl"
+
+    def _meta(self, csv_path: str) -> dict:
+        stat = os.stat(csv_path)
+        source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        meta = self._metas.get(csv_path)
+        if meta is not None and meta["source"] == source:
+            return meta
+
+        partition_dir = self._partition_dir(csv_path)
+        meta_path = os.path.join(partition_dir, "meta.json")
+        meta = None
+        if os.path.exists(meta_path):
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+        if meta is None or meta["source"] != source:
+            print(f"DEBUG: Building SimFin store from: {csv_path}")
+            meta = self._build(csv_path, partition_dir, source)
+
+        self._metas[csv_path] = meta
+        self._tickers[csv_path] = set(meta["tickers"])
+        self._frames = {
+            key: frame for key, frame in self._frames.items() if key[0] != csv_path
+        }
+        return meta
+
+    def _build(self, csv_path: str, partition_dir: str, source: dict) -> dict:
+        df = pd.read_csv(csv_path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        for column in self.DATE_COLUMNS:
+            df[column] = pd.to_datetime(df[column], utc=True).dt.normalize()
+
+        os.makedirs(partition_dir, exist_ok=True)
+        tickers = []
+        for ticker, frame in df.groupby("Ticker", sort=False):
+            # Stable sort keeps the CSV order among equal publish dates
+            frame = frame.sort_values("Publish Date", kind="mergesort")
+            frame.to_pickle(os.path.join(partition_dir, self._partition_file(ticker)))
+            tickers.append(ticker)
+
+        meta = {"source": source, "tickers": tickers}
+        # Write meta last so a half-built store is never picked up
+        with open(os.path.join(partition_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        return meta
+
+    def get_ticker_frame(self, csv_path: str, ticker: str) -> Optional[pd.DataFrame]:
+        """Return a ticker's rows sorted by publish date, or ``None`` if absent."""
+        with self._lock:
+            self._meta(csv_path)
+            key = (csv_path, ticker)
+            if key not in self._frames:
+                if ticker not in self._tickers[csv_path]:
+                    return None
+                self._frames[key] = pd.read_pickle(
+                    os.path.join(
+                        self._partition_dir(csv_path), self._partition_file(ticker)
+                    )
+                )
+            return self._frames[key]
+
+    def latest_as_of(
+        self, csv_path: str, ticker: str, curr_date: str
+    ) -> Optional[pd.Series]:
+        """Return the statement with the latest publish date on or before ``curr_date``.
+
+        Among rows sharing that publish date, the first in CSV order is returned,
+        the same row ``idxmax`` would pick.
+        """
+        frame = self.get_ticker_frame(csv_path, ticker)
+        if frame is None:
+            return None
+
+        # Convert the current date to datetime and normalize
+        curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+
+        publish_dates = frame["Publish Date"]
+        hi = publish_dates.searchsorted(curr_date_dt, side="right")
+        if hi == 0:
+            return None
+        first = publish_dates.searchsorted(publish_dates.iloc[hi - 1], side="left")
+        return frame.iloc[first]
+
+
+_stores: Dict[str, SimFinStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_simfin_store(store_dir: str) -> SimFinStore:
+    """Return the process-wide store for a store directory."""
+    key = os.path.abspath(store_dir)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = SimFinStore(store_dir)
+        return _stores[key]
@@ -1,9 +1,103 @@
 from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+import pandas as pd
 import yfinance as yf
 import os
 from .stockstats_utils import StockstatsUtils
+from .indicator_engine import IndicatorEngine, IndicatorTable
+from .config import get_config
+from .price_cache import load_price_history
+from .fundamentals_bundle import get_fundamentals_bundle, get_statement
+
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+_indicator_engine = None
+
+
+def get_indicator_engine() -> IndicatorEngine:
+    """Return the process-wide indicator engine, creating it on first use."""
+    global _indicator_engine
+    if _indicator_engine is None:
+        config = get_config()
+        _indicator_engine = IndicatorEngine(
+            BEST_IND_PARAMS,
+            max_entries=config.get("indicator_cache_size", 32),
+            backend=config.get("indicator_backend", "numpy"),
+        )
+    return _indicator_engine
+
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -11,14 +105,24 @@ def get_YFin_data_online(
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ):
 
+    """Daily OHLCV bars in ``[start_date, end_date)``.
+
+    Served from the per-symbol price cache (``load_price_history``), which holds
+    ``HISTORY_YEARS`` of adjusted bars; only ranges starting before the cached
+    history are fetched from Yahoo Finance directly.
+    """
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    history, _ = load_price_history(symbol.upper())
+    if len(history) and start_date >= str(history["Date"].iloc[0]):
+        # Same half-open range as Ticker.history
+        in_range = (history["Date"] >= start_date) & (history["Date"] < end_date)
+        data = history.loc[in_range].set_index("Date")
+        data = data[[c for c in ("Open", "High", "Low", "Close", "Volume") if c in data.columns]]
+        data.index = pd.to_datetime(data.index)
+    else:
+        data = yf.Ticker(symbol.upper()).history(start=start_date, end=end_date)
 
     # Check if data is empty
     if data.empty:
@@ -55,113 +159,42 @@ def get_stock_stats_indicators_window(
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in BEST_IND_PARAMS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
         )
 
     end_date = curr_date
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
-    # Optimized: Get stock data once and calculate indicators for all dates
+    # Optimized: indicators are computed once per symbol and served from memory
     try:
-        indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
+        indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date).window(
+            indicator, before.strftime("%Y-%m-%d"), curr_date
+        )
+
         # Generate the date range we need
         current_dt = curr_date_dt
         date_values = []
-        
+
         while current_dt >= before:
             date_str = current_dt.strftime('%Y-%m-%d')
-            
+
             # Look up the indicator value for this date
             if date_str in indicator_data:
                 indicator_value = indicator_data[date_str]
             else:
                 indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
+
             date_values.append((date_str, indicator_value))
             current_dt = current_dt - relativedelta(days=1)
-        
+
         # Build the result string
         ind_string = ""
         for date_str, value in date_values:
             ind_string += f"{date_str}: {value}\n"
-        
+
     except Exception as e:
         print(f"Error getting bulk stockstats data: {e}")
         # Fallback to original implementation if bulk method fails
@@ -178,7 +211,7 @@ def get_stock_stats_indicators_window(
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + BEST_IND_PARAMS.get(indicator, "No description available.")
     )
 
     return result_str
@@ -188,83 +221,52 @@ def _get_stock_stats_bulk(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to calculate"],
     curr_date: Annotated[str, "current date for reference"]
-) -> dict:
+) -> IndicatorTable:
     """
     Optimized bulk calculation of stock stats indicators.
-    Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
+    Returns the symbol's indicator table from the process-wide indicator engine,
+    which loads the price data once and computes every supported indicator for
+    all available dates. The table is keyed by the data file it was built from.
+    When new trading days are appended to the online cache, the indicators are
+    extended from their stored recursive state instead of being recomputed.
     """
-    from .config import get_config
     import pandas as pd
-    from stockstats import wrap
-    import os
-    
+
     config = get_config()
     online = config["data_vendors"]["technical_indicators"] != "local"
-    
+
     if not online:
         # Local data path
-        try:
-            data = pd.read_csv(
-                os.path.join(
-                    config.get("data_cache_dir", "data"),
-                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                )
-            )
-            df = wrap(data)
-        except FileNotFoundError:
-            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-    else:
-        # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-        
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-        
         data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
+            config.get("data_cache_dir", "data"),
+            f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
         )
-        
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
-        
-        df = wrap(data)
-        df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-    
-    # Calculate the indicator for all rows at once
-    df[indicator]  # This triggers stockstats to calculate the indicator
-    
-    # Create a dictionary mapping date strings to indicator values
-    result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
-        # Handle NaN/None values
-        if pd.isna(indicator_value):
-            result_dict[date_str] = "N/A"
-        else:
-            result_dict[date_str] = str(indicator_value)
-    
-    return result_dict
+        if not os.path.exists(data_file):
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+
+        stat = os.stat(data_file)
+        version = (data_file, stat.st_size, stat.st_mtime_ns)
+
+        return get_indicator_engine().get_table(
+            symbol, version, lambda: pd.read_csv(data_file)
+        )
+
+    # Online data: append-only per-symbol cache, only the missing tail is fetched
+    data, data_file = load_price_history(symbol)
+    # The mtime changes when a re-adjusted history rewrites the file at the same length
+    version = (
+        data_file,
+        os.stat(data_file).st_mtime_ns,
+        len(data),
+        str(data["Date"].iloc[-1]) if len(data) else "",
+    )
+
+    return get_indicator_engine().get_table(
+        symbol,
+        version,
+        lambda: data,
+        snapshot_path=os.path.splitext(data_file)[0] + "-indicators.npz",
+    )
 
 
 def get_stockstats_indicator(
@@ -298,14 +300,14 @@ def get_balance_sheet(
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
-    """Get balance sheet data from yfinance."""
+    """Get balance sheet data from yfinance, served from the per-ticker fundamentals bundle."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
+        bundle = get_fundamentals_bundle(ticker)
         
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_balance_sheet
+            data = get_statement(bundle, "quarterly_balance_sheet")
         else:
-            data = ticker_obj.balance_sheet
+            data = get_statement(bundle, "balance_sheet")
             
         if data.empty:
             return f"No balance sheet data found for symbol '{ticker}'"
@@ -315,7 +317,7 @@ def get_balance_sheet(
         
         # Add header information
         header = f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {bundle['retrieved_at']}\n\n"
         
         return header + csv_string
         
@@ -328,14 +330,14 @@ def get_cashflow(
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
-    """Get cash flow data from yfinance."""
+    """Get cash flow data from yfinance, served from the per-ticker fundamentals bundle."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
+        bundle = get_fundamentals_bundle(ticker)
         
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_cashflow
+            data = get_statement(bundle, "quarterly_cashflow")
         else:
-            data = ticker_obj.cashflow
+            data = get_statement(bundle, "cashflow")
             
         if data.empty:
             return f"No cash flow data found for symbol '{ticker}'"
@@ -345,7 +347,7 @@ def get_cashflow(
         
         # Add header information
         header = f"# Cash Flow data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {bundle['retrieved_at']}\n\n"
         
         return header + csv_string
         
@@ -358,14 +360,14 @@ def get_income_statement(
     freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
-    """Get income statement data from yfinance."""
+    """Get income statement data from yfinance, served from the per-ticker fundamentals bundle."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
+        bundle = get_fundamentals_bundle(ticker)
         
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_income_stmt
+            data = get_statement(bundle, "quarterly_income_stmt")
         else:
-            data = ticker_obj.income_stmt
+            data = get_statement(bundle, "income_stmt")
             
         if data.empty:
             return f"No income statement data found for symbol '{ticker}'"
@@ -375,7 +377,7 @@ def get_income_statement(
         
         # Add header information
         header = f"# Income Statement data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {bundle['retrieved_at']}\n\n"
         
         return header + csv_string
         
@@ -386,10 +388,10 @@ def get_income_statement(
 def get_insider_transactions(
     ticker: Annotated[str, "ticker symbol of the company"]
 ):
-    """Get insider transactions data from yfinance."""
+    """Get insider transactions data from yfinance, served from the per-ticker fundamentals bundle."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        data = ticker_obj.insider_transactions
+        bundle = get_fundamentals_bundle(ticker)
+        data = get_statement(bundle, "insider_transactions")
         
         if data is None or data.empty:
             return f"No insider transactions data found for symbol '{ticker}'"
@@ -399,7 +401,7 @@ def get_insider_transactions(
         
         # Add header information
         header = f"# Insider Transactions data for {ticker.upper()}\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {bundle['retrieved_at']}\n\n"
         
         return header + csv_string
         
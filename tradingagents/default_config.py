@@ -20,6 +20,45 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    "parallel_analysts": False,  # Run the selected analysts concurrently
+    # Data cache settings
+    "indicator_cache_size": 32,  # symbols whose indicator tables are kept in memory
+    "indicator_backend": "numpy",  # Options: numpy, stockstats
+    "fundamentals_cache_ttl": 86400,  # Seconds a yfinance fundamentals snapshot is reused
+    # Memory settings
+    "memory_dir": None,  # Defaults to <results_dir>/memory
+    "memory_backend": "chroma",  # Options: chroma, local (NumPy matrix, no server)
+    "embedding_backend": "api",  # Options: api, hashing (local, no network)
+    "hashing_embedding_dim": 1024,
+    "embedding_batch_size": 32,  # Texts per embeddings request
+    # Response cache for route_to_vendor (SQLite, shared across processes)
+    "response_cache": {
+        "enabled": True,
+        "path": None,  # Defaults to <data_cache_dir>/response_cache.sqlite
+        "default_ttl": 3600,
+        "ttl": {  # Seconds per tool category
+            "core_stock_apis": 3600,
+            "technical_indicators": 3600,
+            "fundamental_data": 86400,
+            "news_data": 1800,
+        },
+        "historical_after_days": 7,  # Requests for older dates are cached permanently
+    },
+    # Concurrent vendor calls in route_to_vendor
+    "vendor_max_workers": 8,  # Maximum vendor calls running at once
+    "vendor_timeout": 60,  # Seconds allowed per vendor implementation
+    # Fire the predictable vendor calls concurrently before each graph run
+    "prefetch_data": False,
+    "prefetch_max_workers": 16,  # Threads issuing the prefetch calls
+    # Batch runs fetch each trade date's global news once and share it across tickers
+    "share_global_news": True,
+    "global_news_digest": False,  # Also condense it once into a macro digest with the quick LLM
+    # Client-side Alpha Vantage quota, per API key (ALPHA_VANTAGE_API_KEYS rotates several keys)
+    "alpha_vantage_rate_limit": {
+        "per_minute": 5,
+        "per_day": 25,
+        "max_wait": 60,  # Longer waits raise a rate-limit error so the router falls back
+    },
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
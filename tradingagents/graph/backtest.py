@@ -0,0 +1,142 @@
+# TradingAgents/graph/backtest.py
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from .trading_graph import TradingAgentsGraph
+
+
+class BacktestRunner:
+    """Resumable backtest driver over a (ticker, date) grid.
+
+    The graph is compiled with a SQLite checkpointer, so the output of every node
+    is persisted under a thread id of ``"{ticker}:{date}"``. Finished cells are
+    recorded in a ``backtest_results`` table in the same database. When a job is
+    restarted, recorded cells are skipped. A cell that was interrupted continues
+    from its last completed node instead of starting over.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        debug=False,
+        config: Dict[str, Any] = None,
+    ):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS backtest_results ("
+                " ticker TEXT NOT NULL,"
+                " trade_date TEXT NOT NULL,"
+                " decision TEXT,"
+                " final_trade_decision TEXT,"
+                " completed_at TEXT NOT NULL,"
+                " PRIMARY KEY (ticker, trade_date))"
+            )
+
+        self.checkpointer = SqliteSaver(self.conn)
+        self.ta = TradingAgentsGraph(
+            selected_analysts, debug=debug, config=config, checkpointer=self.checkpointer
+        )
+
+    @staticmethod
+    def thread_id(ticker: str, trade_date: str) -> str:
+        return TradingAgentsGraph.thread_id(ticker, trade_date)
+
+    def is_completed(self, ticker: str, trade_date: str) -> bool:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM backtest_results WHERE ticker = ? AND trade_date = ?",
+                (ticker, str(trade_date)),
+            ).fetchone()
+        return row is not None
+
+    def results(self) -> List[Dict[str, str]]:
+        """Return every recorded cell, ordered by ticker and date."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT ticker, trade_date, decision, final_trade_decision, completed_at"
+                " FROM backtest_results ORDER BY ticker, trade_date"
+            ).fetchall()
+        keys = ("ticker", "trade_date", "decision", "final_trade_decision", "completed_at")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def get_final_state(self, ticker: str, trade_date: str) -> Optional[Dict[str, Any]]:
+        """Return the checkpointed final state of a finished cell."""
+        args = self.ta.graph_args(ticker, str(trade_date))
+        snapshot = self.ta.graph.get_state(args["config"])
+        if not snapshot.values or snapshot.next:
+            return None
+        return snapshot.values
+
+    def run_cell(self, ticker: str, trade_date: str) -> Dict[str, Any]:
+        """Run (or resume) one cell and record it as completed."""
+        trade_date = str(trade_date)
+        args = self.ta.graph_args(ticker, trade_date)
+        snapshot = self.ta.graph.get_state(args["config"])
+
+        if snapshot.next:
+            # Interrupted run: continue from the last checkpointed node
+            print(f"DEBUG: Resuming {ticker} {trade_date} at {list(snapshot.next)}")
+            final_state = self.ta.graph.invoke(None, **args)
+        elif snapshot.values.get("final_trade_decision"):
+            # The graph finished but the result was never recorded
+            final_state = snapshot.values
+        else:
+            self.ta.prefetch(ticker, trade_date)
+            init_agent_state = self.ta.propagator.create_initial_state(ticker, trade_date)
+            final_state = self.ta.graph.invoke(init_agent_state, **args)
+
+        self.ta.log_state(trade_date, final_state)
+        decision = self.ta.process_signal(final_state["final_trade_decision"])
+
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO backtest_results"
+                " (ticker, trade_date, decision, final_trade_decision, completed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    ticker,
+                    trade_date,
+                    decision,
+                    final_state["final_trade_decision"],
+                    datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+        return {"ticker": ticker, "trade_date": trade_date, "final_state": final_state, "decision": decision}
+
+    def run(self, tickers: Iterable[str], trade_dates: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Run every (ticker, date) cell that is not completed yet, yielding results.
+
+        Cells run date by date, so each date's shared context (global news, the
+        Reddit scan) is prepared once for all of its pending tickers.
+        """
+        tickers = list(tickers)
+        for trade_date in (str(d) for d in trade_dates):
+            pending = []
+            for ticker in tickers:
+                if self.is_completed(ticker, trade_date):
+                    print(f"DEBUG: Skipping completed cell {ticker} {trade_date}")
+                else:
+                    pending.append(ticker)
+            if not pending:
+                continue
+
+            shared_dates = self.ta.prepare_batch_dates([(ticker, trade_date) for ticker in pending])
+            try:
+                for ticker in pending:
+                    yield self.run_cell(ticker, trade_date)
+            finally:
+                self.ta.release_batch_dates(shared_dates)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,109 @@
+# TradingAgents/graph/benchmark.py
+
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from tradingagents.agents.utils.agent_utils import (
+    get_stock_data,
+    get_indicators,
+    get_fundamentals,
+    get_balance_sheet,
+    get_cashflow,
+    get_income_statement,
+    get_news,
+    get_insider_sentiment,
+    get_insider_transactions,
+    get_global_news,
+)
+from langgraph.prebuilt import ToolNode
+
+from .conditional_logic import ConditionalLogic
+from .propagation import Propagator
+from .setup import GraphSetup
+
+
+class SimulatedLatencyLLM(BaseChatModel):
+    """Chat model stand-in that answers every call after a fixed delay.
+
+    It never requests tools, so every analyst writes its report after one call.
+    This isolates the graph topology from provider latency and data fetching.
+    """
+
+    latency: float = 0.5
+
+    @property
+    def _llm_type(self) -> str:
+        return "simulated-latency"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content="HOLD"))]
+        )
+
+
+class _EmptyMemory:
+    def get_embedding(self, text):
+        return [0.0]
+
+    def get_memories(self, current_situation, n_matches=1, situation_embedding=None):
+        return []
+
+
+def _tool_nodes() -> Dict[str, ToolNode]:
+    return {
+        "market": ToolNode([get_stock_data, get_indicators]),
+        "social": ToolNode([get_news]),
+        "news": ToolNode(
+            [get_news, get_global_news, get_insider_sentiment, get_insider_transactions]
+        ),
+        "fundamentals": ToolNode(
+            [get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement]
+        ),
+    }
+
+
+def benchmark_analyst_topology(
+    latency: float = 0.5,
+    runs: int = 3,
+    selected_analysts=("market", "social", "news", "fundamentals"),
+) -> Dict[str, float]:
+    """Return the mean wall time of one propagation, sequential vs parallel analysts."""
+    llm = SimulatedLatencyLLM(latency=latency)
+    memory = _EmptyMemory()
+    setup = GraphSetup(
+        llm, llm, _tool_nodes(), memory, memory, memory, memory, memory,
+        ConditionalLogic(),
+    )
+    propagator = Propagator()
+
+    timings = {}
+    for mode, parallel in (("sequential", False), ("parallel", True)):
+        graph = setup.setup_graph(list(selected_analysts), parallel_analysts=parallel)
+        start = time.perf_counter()
+        for _ in range(runs):
+            state = propagator.create_initial_state("SPY", "2024-05-10")
+            graph.invoke(state, config={"recursion_limit": propagator.max_recur_limit})
+        timings[mode] = (time.perf_counter() - start) / runs
+    return timings
+
+
+if __name__ == "__main__":
+    latency = 0.5
+    timings = benchmark_analyst_topology(latency=latency)
+    for mode, seconds in timings.items():
+        print(f"{mode:>10}: {seconds:.2f}s per propagation ({latency}s per LLM call)")
+    print(f"speedup: {timings['sequential'] / timings['parallel']:.2f}x")
@@ -0,0 +1,126 @@
+# TradingAgents/graph/prefetch.py
+
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Sequence, Tuple
+
+from tradingagents.dataflows.interface import get_category_for_method, get_vendor, route_to_vendor
+from tradingagents.dataflows.local import prefetch_reddit_company_news
+from tradingagents.dataflows.date_context import get_shared_context
+from tradingagents.dataflows.y_finance import BEST_IND_PARAMS
+
+
+class Prefetcher:
+    """Warms the data caches for one (ticker, trade_date) before the graph runs.
+
+    The analysts discover their data one LLM turn at a time. Most of it is
+    predictable, so the vendor calls each selected analyst usually makes are
+    fired concurrently up front, with the same arguments the tools pass. They
+    fill the response cache and the per-vendor caches below it, so the tool
+    calls inside the analyst loops are served from cache.
+
+    The calls run on a dedicated pool; each ``route_to_vendor`` call then waits
+    for its own vendor calls, which are bounded by ``vendor_max_workers``.
+    """
+
+    PRICE_LOOK_BACK_DAYS = 30
+    NEWS_LOOK_BACK_DAYS = 7
+    GLOBAL_NEWS_LIMIT = 5
+    STATEMENT_FREQ = "quarterly"
+
+    def __init__(self, max_workers: int = 16):
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _days_before(trade_date: str, days: int) -> str:
+        return (datetime.strptime(trade_date, "%Y-%m-%d") - timedelta(days=days)).strftime("%Y-%m-%d")
+
+    def plan(
+        self, ticker: str, trade_date: str, selected_analysts: Sequence[str]
+    ) -> List[Tuple[str, tuple]]:
+        """Return the ``(method, args)`` vendor calls the selected analysts will likely make."""
+        trade_date = str(trade_date)
+        news_start = self._days_before(trade_date, self.NEWS_LOOK_BACK_DAYS)
+        calls = []
+
+        if "market" in selected_analysts:
+            price_start = self._days_before(trade_date, self.PRICE_LOOK_BACK_DAYS)
+            calls.append(("get_stock_data", (ticker, price_start, trade_date)))
+            # Same default look-back as the get_indicators tool
+            calls.extend(
+                ("get_indicators", (ticker, indicator, trade_date, 30))
+                for indicator in BEST_IND_PARAMS
+            )
+        if "social" in selected_analysts or "news" in selected_analysts:
+            calls.append(("get_news", (ticker, news_start, trade_date)))
+        # Skip global news when a batch run already shared it for this date
+        if "news" in selected_analysts and get_shared_context(trade_date) is None:
+            calls.append(
+                (
+                    "get_global_news",
+                    (trade_date, self.NEWS_LOOK_BACK_DAYS, self.GLOBAL_NEWS_LIMIT),
+                )
+            )
+        if "fundamentals" in selected_analysts:
+            calls.append(("get_fundamentals", (ticker, trade_date)))
+            calls.extend(
+                (method, (ticker, self.STATEMENT_FREQ, trade_date))
+                for method in ("get_balance_sheet", "get_cashflow", "get_income_statement")
+            )
+        if "news" in selected_analysts or "fundamentals" in selected_analysts:
+            calls.append(("get_insider_sentiment", (ticker, trade_date)))
+            calls.append(("get_insider_transactions", (ticker, trade_date)))
+
+        return calls
+
+    @staticmethod
+    def _call(method: str, args: tuple):
+        try:
+            result = route_to_vendor(method, *args)
+            return not (isinstance(result, str) and result.startswith("Error"))
+        except Exception as e:
+            print(f"FAILED: Prefetch of {method}{args}: {e}")
+            return False
+
+    def prefetch(
+        self, ticker: str, trade_date: str, selected_analysts: Sequence[str]
+    ) -> Dict[str, Any]:
+        """Run the planned calls concurrently. Failures are logged and never raised."""
+        calls = self.plan(ticker, trade_date, selected_analysts)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda call: self._call(*call), calls))
+        seconds = time.perf_counter() - start
+
+        failed = [method for (method, _), ok in zip(calls, results) if not ok]
+        print(
+            f"SUCCESS: Prefetched {len(calls) - len(failed)}/{len(calls)} data calls "
+            f"for {ticker} on {trade_date} in {seconds:.2f}s"
+        )
+        return {"calls": len(calls), "failed": failed, "seconds": round(seconds, 2)}
+
+    def prefetch_batch_news(
+        self, pairs: Sequence[Tuple[str, str]], selected_analysts: Sequence[str]
+    ):
+        """Scan the local Reddit company news once per trade date for all tickers of a batch.
+
+        Only done when the local vendor answers ``get_news``. Each run's news tool
+        then takes its ticker's posts from the shared scan.
+        """
+        if "social" not in selected_analysts and "news" not in selected_analysts:
+            return
+        vendors = get_vendor(get_category_for_method("get_news"), "get_news")
+        if "local" not in [v.strip() for v in vendors.split(",")]:
+            return
+
+        tickers_by_date = defaultdict(list)
+        for ticker, trade_date in pairs:
+            tickers_by_date[str(trade_date)].append(ticker)
+        for trade_date, tickers in tickers_by_date.items():
+            news_start = self._days_before(trade_date, self.NEWS_LOOK_BACK_DAYS)
+            try:
+                prefetch_reddit_company_news(tickers, news_start, trade_date)
+            except Exception as e:
+                print(f"FAILED: Shared Reddit news scan for {trade_date}: {e}")
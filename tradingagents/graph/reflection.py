@@ -1,12 +1,28 @@
 # TradingAgents/graph/reflection.py
 
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Sequence
 from langchain_openai import ChatOpenAI
 
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
 
+    # memory name -> (component label, extractor of the text to reflect on)
+    COMPONENTS = {
+        "bull": ("BULL", lambda state: state["investment_debate_state"]["bull_history"]),
+        "bear": ("BEAR", lambda state: state["investment_debate_state"]["bear_history"]),
+        "trader": ("TRADER", lambda state: state["trader_investment_plan"]),
+        "invest_judge": (
+            "INVEST JUDGE",
+            lambda state: state["investment_debate_state"]["judge_decision"],
+        ),
+        "risk_manager": (
+            "RISK JUDGE",
+            lambda state: state["risk_debate_state"]["judge_decision"],
+        ),
+    }
+
     def __init__(self, quick_thinking_llm: ChatOpenAI):
         """Initialize the reflector with an LLM."""
         self.quick_thinking_llm = quick_thinking_llm
@@ -119,3 +135,70 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
             "RISK JUDGE", judge_decision, situation, returns_losses
         )
         risk_manager_memory.add_situations([(situation, result)])
+
+    def reflect_many(
+        self,
+        states: Sequence[Dict[str, Any]],
+        returns_losses: Sequence[Any],
+        memories: Dict[str, Any],
+        max_concurrency: int = 8,
+    ):
+        """Reflect on many final states concurrently and batch the memory inserts.
+
+        ``memories`` maps the keys of ``COMPONENTS`` to their memory. All reflection
+        LLM calls run on a bounded thread pool. Each situation is embedded once,
+        reusing ``situation_embedding`` from the state when the graph computed it,
+        and every memory then receives its reflections in a single insert. A failed
+        reflection is logged and skipped; the others are still stored. Returns the
+        number of failed reflections.
+        """
+        if len(states) != len(returns_losses):
+            raise ValueError("states and returns_losses must have the same length")
+
+        situations = [self._extract_current_situation(state) for state in states]
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                name: [
+                    executor.submit(
+                        self._reflect_on_component, label, extract(state), situation, returns
+                    )
+                    for state, situation, returns in zip(states, situations, returns_losses)
+                ]
+                for name, (label, extract) in self.COMPONENTS.items()
+                if name in memories
+            }
+
+            # Embed the situations while the reflections are running
+            embedder = next(iter(memories.values()))
+            missing = [
+                i for i, state in enumerate(states) if not state.get("situation_embedding")
+            ]
+            computed = {}
+            if missing:
+                computed = dict(
+                    zip(missing, embedder.get_embeddings([situations[i] for i in missing]))
+                )
+            embeddings = [
+                computed[i] if i in computed else state["situation_embedding"]
+                for i, state in enumerate(states)
+            ]
+
+            results = {}
+            failed = 0
+            for name, fs in futures.items():
+                results[name] = []
+                for i, future in enumerate(fs):
+                    try:
+                        results[name].append((i, future.result()))
+                    except Exception as e:
+                        failed += 1
+                        print(f"FAILED: Reflection of {name} for {states[i].get('company_of_interest')} {states[i].get('trade_date')}: {e}")
+
+        for name, reflections in results.items():
+            if reflections:
+                memories[name].add_situations(
+                    [(situations[i], reflection) for i, reflection in reflections],
+                    embeddings=[embeddings[i] for i, _ in reflections],
+                )
+        return failed
@@ -37,8 +37,24 @@ class GraphSetup:
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
 
+    @staticmethod
+    def _on_channel(func, channel: str):
+        """Run a node or router that uses ``messages`` against another message channel."""
+
+        def wrapped(state):
+            result = func({**state, "messages": state[channel]})
+            if isinstance(result, dict) and "messages" in result:
+                result = dict(result)
+                result[channel] = result.pop("messages")
+            return result
+
+        return wrapped
+
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts=False,
+        checkpointer=None,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +64,12 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run the analysts concurrently instead of one
+                after another. Each analyst then keeps its conversation in its own
+                ``<analyst>_messages`` channel, and all of them join before the
+                Bull Researcher.
+            checkpointer: Optional LangGraph checkpointer. Node outputs are then
+                persisted per ``thread_id``, so an interrupted run can be resumed.
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -85,6 +107,9 @@ class GraphSetup:
             delete_nodes["fundamentals"] = create_msg_delete()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
+        # Embeds the analyst reports once for every memory lookup below
+        embed_situation_node = create_situation_embedder(self.bull_memory)
+
         # Create researcher and manager nodes
         bull_researcher_node = create_bull_researcher(
             self.quick_thinking_llm, self.bull_memory
@@ -108,6 +133,20 @@ class GraphSetup:
         # Create workflow
         workflow = StateGraph(AgentState)
 
+        if parallel_analysts:
+            for analyst_type in analyst_nodes:
+                channel = f"{analyst_type}_messages"
+                analyst_nodes[analyst_type] = self._on_channel(
+                    analyst_nodes[analyst_type], channel
+                )
+                delete_nodes[analyst_type] = self._on_channel(
+                    delete_nodes[analyst_type], channel
+                )
+                tool_nodes[analyst_type] = ToolNode(
+                    list(tool_nodes[analyst_type].tools_by_name.values()),
+                    messages_key=channel,
+                )
+
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
             workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
@@ -117,6 +156,7 @@ class GraphSetup:
             workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
         # Add other nodes
+        workflow.add_node("Embed Situation", embed_situation_node)
         workflow.add_node("Bull Researcher", bull_researcher_node)
         workflow.add_node("Bear Researcher", bear_researcher_node)
         workflow.add_node("Research Manager", research_manager_node)
@@ -127,32 +167,57 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
+        if parallel_analysts:
+            # Fan out from START, each analyst runs its own tool loop
+            for analyst_type in selected_analysts:
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+                workflow.add_edge(START, current_analyst)
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    self._on_channel(
+                        getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                        f"{analyst_type}_messages",
+                    ),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
+
+            # Join: the situation is embedded once every analyst has finished
+            workflow.add_edge(
+                [f"Msg Clear {a.capitalize()}" for a in selected_analysts],
+                "Embed Situation",
             )
-            workflow.add_edge(current_tools, current_analyst)
+        else:
+            # Start with the first analyst
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+
+            # Connect analysts in sequence
+            for i, analyst_type in enumerate(selected_analysts):
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+                # Connect to next analyst or to Bull Researcher if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    workflow.add_edge(current_clear, "Embed Situation")
 
         # Add remaining edges
+        workflow.add_edge("Embed Situation", "Bull Researcher")
         workflow.add_conditional_edges(
             "Bull Researcher",
             self.conditional_logic.should_continue_debate,
@@ -199,4 +264,4 @@ class GraphSetup:
         workflow.add_edge("Risk Judge", END)
 
         # Compile and return
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
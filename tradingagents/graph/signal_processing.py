@@ -1,7 +1,30 @@
 # TradingAgents/graph/signal_processing.py
 
+import re
+import threading
+from typing import Dict, Optional
+
 from langchain_openai import ChatOpenAI
 
+DECISIONS = {
+    "BUY": "BUY",
+    "SELL": "SELL",
+    "HOLD": "HOLD",
+    "买入": "BUY",
+    "卖出": "SELL",
+    "持有": "HOLD",
+}
+_DECISION = r"(BUY|SELL|HOLD|买入|卖出|持有)"
+
+# An explicit final proposal, e.g. "FINAL TRANSACTION PROPOSAL: **BUY**" or "最终交易建议: **买入**".
+# Only final markers count, and the decision must stand alone ("买入部分" does not match).
+EXPLICIT_PATTERN = re.compile(
+    r"(?:FINAL\s+(?:TRANSACTION\s+PROPOSAL|DECISION|RECOMMENDATION)"
+    r"|最终(?:交易)?(?:建议|决策|决定|结论|推荐)"
+    r")\s*\**\s*[:：]\s*\**\s*" + _DECISION + r"(?![A-Za-z\u4e00-\u9fff])",
+    re.IGNORECASE,
+)
+
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
@@ -9,6 +32,21 @@ class SignalProcessor:
     def __init__(self, quick_thinking_llm: ChatOpenAI):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
+        self.rule_hits = 0
+        self.llm_fallbacks = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def extract_decision(full_signal: str) -> Optional[str]:
+        """Extract BUY, SELL or HOLD without an LLM, or ``None`` when ambiguous.
+
+        Only explicit final proposals count, and they must all agree. Decision words
+        elsewhere (e.g. a bolded **SELL** quoting the bear) are left to the LLM.
+        """
+        explicit = {DECISIONS[d.upper()] for d in EXPLICIT_PATTERN.findall(full_signal)}
+        if len(explicit) == 1:
+            return explicit.pop()
+        return None
 
     def process_signal(self, full_signal: str) -> str:
         """
@@ -20,6 +58,15 @@ class SignalProcessor:
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
+        decision = self.extract_decision(full_signal)
+        if decision is not None:
+            with self._stats_lock:
+                self.rule_hits += 1
+            return decision
+
+        with self._stats_lock:
+            self.llm_fallbacks += 1
+
         messages = [
             (
                 "system",
@@ -29,3 +76,13 @@ class SignalProcessor:
         ]
 
         return self.quick_thinking_llm.invoke(messages).content
+
+    def stats(self) -> Dict[str, float]:
+        """Counts of rule-based extractions and LLM fallbacks."""
+        with self._stats_lock:
+            total = self.rule_hits + self.llm_fallbacks
+            return {
+                "rule_hits": self.rule_hits,
+                "llm_fallbacks": self.llm_fallbacks,
+                "llm_fallback_rate": self.llm_fallbacks / total if total else 0.0,
+            }
@@ -3,8 +3,12 @@
 import os
 from pathlib import Path
 import json
+import asyncio
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Iterable, Iterator, AsyncIterator
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -21,6 +25,9 @@ from tradingagents.agents.utils.agent_states import (
     RiskDebateState,
 )
 from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.alpha_vantage_common import aclose_async_client
+from tradingagents.dataflows.date_context import get_date_context_registry
 
 # Import the new abstract tool methods from agent_utils
 from tradingagents.agents.utils.agent_utils import (
@@ -41,6 +48,7 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .prefetch import Prefetcher
 
 
 class TradingAgentsGraph:
@@ -51,6 +59,7 @@ class TradingAgentsGraph:
         selected_analysts=["market", "social", "news", "fundamentals"],
         debug=False,
         config: Dict[str, Any] = None,
+        checkpointer=None,
     ):
         """Initialize the trading agents graph and components.
 
@@ -58,9 +67,11 @@ class TradingAgentsGraph:
             selected_analysts: List of analyst types to include
             debug: Whether to run in debug mode
             config: Configuration dictionary. If None, uses default config
+            checkpointer: Optional LangGraph checkpointer to compile the graph with
         """
         self.debug = debug
         self.config = config or DEFAULT_CONFIG
+        self.checkpointer = checkpointer
 
         # Update the interface's config
         set_config(self.config)
@@ -111,14 +122,22 @@ class TradingAgentsGraph:
         self.propagator = Propagator()
         self.reflector = Reflector(self.quick_thinking_llm)
         self.signal_processor = SignalProcessor(self.quick_thinking_llm)
+        self.prefetcher = Prefetcher(self.config.get("prefetch_max_workers", 16))
 
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.log_states_dict = {}  # (ticker, date) to full state dict
+        self._ticker_logs = defaultdict(dict)  # ticker to {date: full state dict}
+        self._log_lock = threading.Lock()
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.selected_analysts = list(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            checkpointer=checkpointer,
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources using abstract methods."""
@@ -161,12 +180,13 @@ class TradingAgentsGraph:
         """Run the trading agents graph for a company on a specific date."""
 
         self.ticker = company_name
+        self.prefetch(company_name, trade_date)
 
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
-        args = self.propagator.get_graph_args()
+        args = self.graph_args(company_name, trade_date)
 
         if self.debug:
             # Debug mode with tracing
@@ -187,14 +207,201 @@ class TradingAgentsGraph:
         self.curr_state = final_state
 
         # Log state
-        self._log_state(trade_date, final_state)
+        self.log_state(trade_date, final_state)
 
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
-    def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+    def propagate_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        max_concurrency: int = 4,
+    ) -> Iterator[Dict[str, Any]]:
+        """Run the graph for many ``(company_name, trade_date)`` pairs concurrently.
+
+        All runs share this instance's compiled graph, LLM clients and data caches.
+        Results are yielded as soon as each run finishes, so the order may differ
+        from ``pairs``. Each result is a dict with ``ticker``, ``trade_date``,
+        ``final_state``, ``decision`` and ``error``. A failing run sets ``error``
+        and does not stop the batch. ``curr_state`` is not updated; pass the
+        final states to the reflection step explicitly instead.
+        """
+        pairs = list(pairs)
+        shared_dates = self.prepare_batch_dates(pairs)
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            futures = {
+                executor.submit(self._propagate_one, company_name, trade_date): (
+                    company_name,
+                    trade_date,
+                )
+                for company_name, trade_date in pairs
+            }
+            for future in as_completed(futures):
+                company_name, trade_date = futures[future]
+                try:
+                    final_state, decision = future.result()
+                    yield self._batch_result(company_name, trade_date, final_state, decision)
+                except Exception as e:
+                    yield self._batch_result(company_name, trade_date, error=e)
+        finally:
+            # If the caller stops iterating early, drop the runs that have not started
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.release_batch_dates(shared_dates)
+
+    async def apropagate_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of ``propagate_many`` using ``graph.ainvoke`` and a semaphore."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(company_name, trade_date):
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(self.prefetch, company_name, trade_date)
+                    init_agent_state = self.propagator.create_initial_state(
+                        company_name, trade_date
+                    )
+                    final_state = await self.graph.ainvoke(
+                        init_agent_state, **self.graph_args(company_name, trade_date)
+                    )
+                    await asyncio.to_thread(self.log_state, trade_date, final_state)
+                    decision = await asyncio.to_thread(
+                        self.process_signal, final_state["final_trade_decision"]
+                    )
+                    return self._batch_result(company_name, trade_date, final_state, decision)
+                except Exception as e:
+                    return self._batch_result(company_name, trade_date, error=e)
+
+        pairs = list(pairs)
+        shared_dates = await asyncio.to_thread(self.prepare_batch_dates, pairs)
+
+        tasks = [
+            asyncio.create_task(run(company_name, trade_date))
+            for company_name, trade_date in pairs
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.release_batch_dates(shared_dates)
+            # The session's Alpha Vantage client is bound to this loop
+            await aclose_async_client()
+
+    def _propagate_one(self, company_name, trade_date):
+        """Run one pair without touching the single-run tracking attributes."""
+        self.prefetch(company_name, trade_date)
+        init_agent_state = self.propagator.create_initial_state(company_name, trade_date)
+        final_state = self.graph.invoke(
+            init_agent_state, **self.graph_args(company_name, trade_date)
+        )
+        self.log_state(trade_date, final_state)
+        return final_state, self.process_signal(final_state["final_trade_decision"])
+
+    def prepare_date_context(self, trade_date, look_back_days=7, limit=5):
+        """Fetch a trade date's global news once and share it with every run on that date.
+
+        With ``global_news_digest`` enabled, the quick-thinking LLM also condenses it
+        into a macro digest once, which the news analysts read instead of the raw
+        articles. Returns the registered context, or ``None`` if the fetch failed.
+        """
+        registry = get_date_context_registry()
+        trade_date = str(trade_date)
+        context = registry.get(trade_date)
+        if context is not None:
+            return context
+
+        global_news = route_to_vendor("get_global_news", trade_date, look_back_days, limit)
+        if not global_news or (isinstance(global_news, str) and global_news.startswith("Error")):
+            print(f"FAILED: No shared global news for {trade_date}; news analysts will fetch it themselves")
+            return None
+
+        digest = None
+        if self.config.get("global_news_digest", False):
+            digest = self.quick_thinking_llm.invoke(
+                [
+                    (
+                        "system",
+                        "You are a macroeconomic analyst. Condense the following global news into a concise digest of the developments that matter for trading: monetary policy, macro data, geopolitics, sector-wide moves and market sentiment. Keep concrete facts, figures and dates.",
+                    ),
+                    ("human", global_news),
+                ]
+            ).content
+
+        registry.set(trade_date, global_news, look_back_days, limit, digest=digest)
+        return registry.get(trade_date)
+
+    def prepare_batch_dates(self, pairs):
+        """Fill the shared context once per distinct trade date of a batch.
+
+        The Reddit company news of all tickers on a date is scanned in one pass, and
+        the date's global news is fetched once when ``share_global_news`` is enabled.
+        Returns the dates this call registered; pass them to ``release_batch_dates``
+        when the batch is done so later runs do not reuse the shared news.
+        """
+        self.prefetcher.prefetch_batch_news(pairs, self.selected_analysts)
+        if "news" not in self.selected_analysts or not self.config.get("share_global_news", True):
+            return []
+
+        registry = get_date_context_registry()
+        registered = []
+        for trade_date in dict.fromkeys(str(trade_date) for _, trade_date in pairs):
+            if registry.get(trade_date) is not None:
+                continue
+            try:
+                if self.prepare_date_context(trade_date) is not None:
+                    registered.append(trade_date)
+            except Exception as e:
+                print(f"FAILED: Preparing shared context for {trade_date}: {e}")
+        return registered
+
+    @staticmethod
+    def release_batch_dates(trade_dates):
+        """Drop the shared context of dates registered by ``prepare_batch_dates``."""
+        registry = get_date_context_registry()
+        for trade_date in trade_dates:
+            registry.clear(trade_date)
+
+    @staticmethod
+    def thread_id(company_name, trade_date):
+        """Checkpoint thread of one ``(company_name, trade_date)`` run."""
+        return f"{company_name}:{trade_date}"
+
+    def graph_args(self, company_name, trade_date):
+        """Invocation arguments for one run.
+
+        With a checkpointer, each ``(company_name, trade_date)`` run gets its own
+        checkpoint thread, which LangGraph requires in the config.
+        """
+        if self.checkpointer is None:
+            return self.propagator.get_graph_args()
+        return self.propagator.get_graph_args(self.thread_id(company_name, str(trade_date)))
+
+    def prefetch(self, company_name, trade_date):
+        """Warm the data caches for a run when ``prefetch_data`` is enabled."""
+        if self.config.get("prefetch_data", False):
+            self.prefetcher.prefetch(company_name, str(trade_date), self.selected_analysts)
+
+    @staticmethod
+    def _batch_result(company_name, trade_date, final_state=None, decision=None, error=None):
+        return {
+            "ticker": company_name,
+            "trade_date": str(trade_date),
+            "final_state": final_state,
+            "decision": decision,
+            "error": error,
+        }
+
+    def log_state(self, trade_date, final_state):
+        """Log the final state to a JSON file. Safe to call from concurrent runs."""
+        ticker = final_state["company_of_interest"]
+        entry = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -224,32 +431,40 @@ class TradingAgentsGraph:
             "final_trade_decision": final_state["final_trade_decision"],
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
-        directory.mkdir(parents=True, exist_ok=True)
+        with self._log_lock:
+            self.log_states_dict[(ticker, str(trade_date))] = entry
+            self._ticker_logs[ticker][str(trade_date)] = entry
 
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            # Save to file
+            directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
+            directory.mkdir(parents=True, exist_ok=True)
+
+            with open(
+                f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+                "w",
+            ) as f:
+                json.dump(self._ticker_logs[ticker], f, indent=4)
 
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns."""
-        self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
-        )
-        self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
-        )
-        self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
-        )
-        self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+        self.reflect_many([self.curr_state], [returns_losses])
+
+    def reflect_many(self, states, returns_losses, max_concurrency=8):
+        """Reflect on many final states (e.g. from ``propagate_many``) concurrently.
+
+        Returns the number of reflections that failed and were not stored.
+        """
+        return self.reflector.reflect_many(
+            states,
+            returns_losses,
+            {
+                "bull": self.bull_memory,
+                "bear": self.bear_memory,
+                "trader": self.trader_memory,
+                "invest_judge": self.invest_judge_memory,
+                "risk_manager": self.risk_manager_memory,
+            },
+            max_concurrency=max_concurrency,
         )
 
     def process_signal(self, full_signal):